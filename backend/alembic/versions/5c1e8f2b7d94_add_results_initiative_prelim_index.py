@@ -0,0 +1,32 @@
+"""add composite index on results (initiative_id, prelim_rating)
+
+Revision ID: 5c1e8f2b7d94
+Revises: 3a0ccd2a4db9
+Create Date: 2026-10-15 10:02:41.118204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e8f2b7d94"
+down_revision: str | Sequence[str] | None = "3a0ccd2a4db9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_results_initiative_prelim",
+        "results",
+        ["initiative_id", "prelim_rating"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_results_initiative_prelim", table_name="results")
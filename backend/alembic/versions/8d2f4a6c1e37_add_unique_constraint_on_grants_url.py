@@ -0,0 +1,66 @@
+"""add unique constraint on grants.url
+
+Revision ID: 8d2f4a6c1e37
+Revises: 5c1e8f2b7d94
+Create Date: 2026-10-15 11:24:09.530117
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2f4a6c1e37"
+down_revision: str | Sequence[str] | None = "5c1e8f2b7d94"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Grants that share their URL with a newer grant (higher id)
+_SUPERSEDED_GRANT_IDS = """
+    SELECT g.id FROM grants g JOIN grants newer ON newer.url = g.url AND newer.id > g.id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Grants were never unique by URL, so duplicates are merged into the newest
+    grant (max id) per URL first. Where several copies have a result for the
+    same initiative, only the result on the newest copy is kept; the other
+    results are moved over to the newest grant.
+    """
+    op.execute(
+        """
+        DELETE FROM results
+        WHERE EXISTS (
+            SELECT 1
+            FROM grants g
+            JOIN grants newer ON newer.url = g.url AND newer.id > g.id
+            JOIN results newer_result
+                ON newer_result.grant_id = newer.id
+                AND newer_result.initiative_id = results.initiative_id
+            WHERE g.id = results.grant_id
+        )
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE results
+        SET grant_id = (
+            SELECT MAX(newest.id)
+            FROM grants g
+            JOIN grants newest ON newest.url = g.url
+            WHERE g.id = results.grant_id
+        )
+        WHERE grant_id IN ({_SUPERSEDED_GRANT_IDS})
+        """
+    )
+    op.execute(f"DELETE FROM grants WHERE id IN ({_SUPERSEDED_GRANT_IDS})")
+    op.create_unique_constraint("grants_url_key", "grants", ["url"])
+
+
+def downgrade() -> None:
+    """Downgrade schema. Merged duplicate grants are not restored."""
+    op.drop_constraint("grants_url_key", "grants", type_="unique")
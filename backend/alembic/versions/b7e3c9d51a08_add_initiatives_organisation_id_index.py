@@ -0,0 +1,32 @@
+"""add index on initiatives.organisation_id
+
+Revision ID: b7e3c9d51a08
+Revises: 8d2f4a6c1e37
+Create Date: 2026-10-15 11:41:52.208764
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e3c9d51a08"
+down_revision: str | Sequence[str] | None = "8d2f4a6c1e37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_initiatives_organisation_id",
+        "initiatives",
+        ["organisation_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_initiatives_organisation_id", table_name="initiatives")
@@ -0,0 +1,44 @@
+"""change results.explanations from json to jsonb
+
+Revision ID: e41a7b2f9c60
+Revises: b7e3c9d51a08
+Create Date: 2026-10-15 11:58:30.642915
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e41a7b2f9c60"
+down_revision: str | Sequence[str] | None = "b7e3c9d51a08"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "results",
+        "explanations",
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="explanations::jsonb",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "results",
+        "explanations",
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="explanations::json",
+    )
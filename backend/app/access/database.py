@@ -3,14 +3,35 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import DB_URL
 
+# Connection pool settings for Postgres. The refresh job, the pipeline thread
+# and API requests can all hold sessions at once, and pre-ping/recycle stop
+# connections dropped by the server (e.g. Supabase's pooler) from surfacing
+# as errors.
+_POSTGRES_ENGINE_OPTIONS = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+    "connect_args": {"application_name": "grantscraper"},
+}
+
 # Create engine and session factory
-engine = create_engine(DB_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    DB_URL,
+    **(
+        _POSTGRES_ENGINE_OPTIONS
+        if make_url(DB_URL).get_backend_name() == "postgresql"
+        else {}
+    ),
+)
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 @contextmanager
@@ -1,8 +1,15 @@
 """CRUD operations for Grant model."""
 
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from app.models.models import Grant
+from app.models.models import Grant, Result
+
+# Columns written by the bulk upsert; everything except the generated id
+_UPSERT_COLUMNS = [
+    column.name for column in Grant.__table__.columns if column.name != "id"
+]
 
 
 class GrantAccess:
@@ -28,6 +35,21 @@ class GrantAccess:
         """Get grants by a list of IDs."""
         return db.query(Grant).filter(Grant.id.in_(grant_ids)).all()
 
+    @staticmethod
+    def get_filtered_by_prelim(
+        db: Session, initiative_id: int, min_rating: int
+    ) -> list[Grant]:
+        """Get grants whose preliminary rating for an initiative is above threshold."""
+        return (
+            db.query(Grant)
+            .join(Result, Result.grant_id == Grant.id)
+            .filter(
+                Result.initiative_id == initiative_id,
+                Result.prelim_rating > min_rating,
+            )
+            .all()
+        )
+
     @staticmethod
     def create(db: Session, grant: Grant) -> Grant:
         """Create a new grant."""
@@ -54,20 +76,52 @@ class GrantAccess:
 
     @staticmethod
     def create_many(db: Session, grants: list[Grant]) -> list[Grant]:
-        """Create multiple grants."""
-        db.add_all(grants)
+        """Create multiple grants.
+
+        Inserts all rows with one bulk INSERT ... RETURNING, rather than
+        flushing the grants through the unit of work and refreshing each one.
+        Grants are returned in the same order as given.
+        """
+        if not grants:
+            return []
+        rows = [
+            {column: getattr(grant, column) for column in _UPSERT_COLUMNS}
+            for grant in grants
+        ]
+        stmt = insert(Grant).returning(Grant, sort_by_parameter_order=True)
+        saved = list(db.scalars(stmt, rows).all())
         db.commit()
-        for grant in grants:
-            db.refresh(grant)
-        return grants
+        return saved
 
     @staticmethod
     def create_or_update_many_by_url(db: Session, grants: list[Grant]) -> list[Grant]:
-        """Create or update multiple grants (matched by URL)."""
-        result = []
-        for grant in grants:
-            result.append(GrantAccess.create_or_update_by_url(db, grant))
-        return result
+        """Create or update multiple grants (matched by URL).
+
+        Uses a single INSERT ... ON CONFLICT (url) DO UPDATE statement instead
+        of a lookup and write per grant. If the same URL appears more than
+        once, the last grant wins.
+        """
+        rows = {
+            grant.url: {column: getattr(grant, column) for column in _UPSERT_COLUMNS}
+            for grant in grants
+        }
+        if not rows:
+            return []
+
+        stmt = pg_insert(Grant).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Grant.url],
+            set_={
+                column: stmt.excluded[column]
+                for column in _UPSERT_COLUMNS
+                if column != "url"
+            },
+        ).returning(Grant)
+        saved = list(
+            db.scalars(stmt, execution_options={"populate_existing": True}).all()
+        )
+        db.commit()
+        return saved
 
     @staticmethod
     def update(db: Session, grant: Grant) -> Grant:
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 from .models import Result
 
@@ -14,6 +14,8 @@ class GeminiPreliminaryAnalysis(BaseModel):
     Schema for Gemini to return preliminary grant relevance rating.
     """
 
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
     rating: int = Field(
         ge=0,
         le=100,
@@ -77,8 +79,10 @@ class GeminiDeepAnalysis(BaseModel):
         description="Description of the sponsor organization, its mission, and background"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "grant_description": "Supports technology adoption for eldercare services",
                 "criteria": [
@@ -96,7 +100,8 @@ class GeminiDeepAnalysis(BaseModel):
                 "sponsor_name": "Ministry of Social and Family Development",
                 "sponsor_description": "Government ministry responsible for social development and family support services in Singapore",
             }
-        }
+        },
+    )
 
 
 class GeminiBatchAnalysis(BaseModel):
@@ -1,14 +1,14 @@
 from sqlalchemy import (
-    JSON,
     BigInteger,
     CheckConstraint,
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -24,7 +24,7 @@ class Grant(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     issuer = Column(Text, nullable=True)
     name = Column(Text, nullable=False)
-    url = Column(Text, nullable=False)
+    url = Column(Text, nullable=False, unique=True)  # Upsert key for scraped grants
     button_text = Column(Text, nullable=True)  # Button text from listing page
     card_body_text = Column(Text, nullable=True)  # Clean text content (for LLM)
     card_body_html = Column(Text, nullable=True)  # HTML content (if use_text=False)
@@ -91,7 +91,9 @@ class Initiative(Base):
     __tablename__ = "initiatives"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    organisation_id = Column(Integer, ForeignKey("organisations.id"), nullable=False)
+    organisation_id = Column(
+        Integer, ForeignKey("organisations.id"), nullable=False, index=True
+    )  # Indexed for InitiativeAccess.get_by_organisation_id
     title = Column(Text, nullable=False)
     goals = Column(Text, nullable=False)  # Objective of the initiative
     audience = Column(Text, nullable=False)  # Target beneficiaries
@@ -126,8 +128,8 @@ class Result(Base):
     sponsor_name = Column(Text, nullable=True)  # Name of the grant sponsor
     sponsor_description = Column(Text, nullable=True)  # Description of the sponsor
 
-    # Explanations as JSON
-    explanations = Column(JSON, nullable=True)
+    # Explanations as JSONB (stored parsed, so reads skip re-parsing the text)
+    explanations = Column(JSONB, nullable=True)
     # Expected structure:
     # {
     #   "match_rating": "string explaining match rating",
@@ -146,6 +148,8 @@ class Result(Base):
             "uncertainty_rating >= 0 AND uncertainty_rating <= 100",
             name="check_uncertainty_rating",
         ),
+        # Serves the Phase 2 "initiative + prelim_rating above threshold" filter
+        Index("ix_results_initiative_prelim", "initiative_id", "prelim_rating"),
     )
 
     # Relationships
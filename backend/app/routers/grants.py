@@ -43,7 +43,8 @@ async def refresh_grants(
 
     Args:
         headless: Run browser in headless mode (default: True)
-        take_screenshots: Save debug screenshots during scraping (default: False)
+        take_screenshots: Save debug screenshots during scraping (default: False).
+            Ignored unless the server runs with SCRAPER_DEBUG=1.
 
     Returns:
         Job information including:
@@ -1,8 +1,13 @@
+import asyncio
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.async_api import Page as AsyncPage
 from playwright.sync_api import Page
 
+from app.services.scraper import DEFAULT_MAX_CONCURRENCY, PagePool
+
 
 def extract_page_content_and_links(page: Page, url: str) -> dict[str, Any]:
     """Extract content and links from a page.
@@ -48,10 +53,11 @@ def extract_page_content_and_links(page: Page, url: str) -> dict[str, Any]:
             link_elements = body.locator("a[href]")
 
         # Extract all links
-        link_count = link_elements.count()
-        print(f"  Found {link_count} link element(s)")
-        for i in range(link_count):
-            href = link_elements.nth(i).get_attribute("href")
+        hrefs = link_elements.evaluate_all(
+            "els => els.map(el => el.getAttribute('href'))"
+        )
+        print(f"  Found {len(hrefs)} link element(s)")
+        for href in hrefs:
             if href:
                 # Convert relative URLs to absolute
                 if href.startswith("http"):
@@ -61,10 +67,7 @@ def extract_page_content_and_links(page: Page, url: str) -> dict[str, Any]:
                     result["links"].append(absolute_url)
 
         # Remove duplicates while preserving order
-        seen = set()
-        result["links"] = [
-            link for link in result["links"] if link not in seen and not seen.add(link)
-        ]
+        result["links"] = list(dict.fromkeys(result["links"]))
         print(f"  Extracted {len(result['links'])} unique link(s)")
 
         content_length = len(result["content"]) if result["content"] else 0
@@ -245,3 +248,181 @@ def deep_scrape_grants(
         )
 
     return results
+
+
+async def extract_page_content_and_links_async(
+    page: AsyncPage, url: str
+) -> dict[str, Any]:
+    """Async version of extract_page_content_and_links().
+
+    Args:
+        page: Playwright async page object
+        url: URL of the page to visit
+
+    Returns:
+        Same dictionary as extract_page_content_and_links()
+    """
+    result = {
+        "url": url,
+        "content": None,
+        "links": [],
+        "error": None,
+    }
+
+    print(f"Extracting content from: {url}")
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        await page.wait_for_load_state("networkidle", timeout=10000)
+
+        # Try to extract from .card-body first (common for grant pages)
+        card_body = page.locator(".card-body").first
+        if await card_body.count() > 0:
+            result["content"] = await card_body.inner_text()
+            link_elements = card_body.locator("a[href]")
+        else:
+            # Fallback to body content if no card-body
+            body = page.locator("body")
+            result["content"] = await body.inner_text()
+            link_elements = body.locator("a[href]")
+
+        hrefs = await link_elements.evaluate_all(
+            "els => els.map(el => el.getAttribute('href'))"
+        )
+        for href in hrefs:
+            if href:
+                # Convert relative URLs to absolute
+                if href.startswith("http"):
+                    result["links"].append(href)
+                else:
+                    result["links"].append(urljoin(url, href))
+
+        # Remove duplicates while preserving order
+        result["links"] = list(dict.fromkeys(result["links"]))
+        print(f"  Extracted {len(result['links'])} unique link(s) from {url}")
+
+    except Exception as e:
+        result["error"] = str(e)
+        print(f"  Error extracting content from {url}: {e}")
+
+    return result
+
+
+def _new_deep_node(url: str, error: str | None = None) -> dict[str, Any]:
+    """Create an empty result node in the shape returned by scrape_url_recursive()."""
+    return {
+        "url": url,
+        "content": None,
+        "links": [],
+        "nested_content": [],
+        "error": error,
+    }
+
+
+async def deep_scrape_grants_async(
+    context: AsyncBrowserContext,
+    grant_details: list[dict[str, Any]],
+    max_depth: int = 4,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """Concurrent version of deep_scrape_grants().
+
+    Pages to visit go on a shared queue that max_concurrency workers drain,
+    each worker leasing a page from a PagePool in the given context. Links
+    found on a page are queued as children of that page's result node, so the
+    returned tree has the same shape as deep_scrape_grants(). Pages are
+    visited breadth-first rather than depth-first, so when a URL is reachable
+    twice, the shallower occurrence is the one scraped.
+
+    Args:
+        context: Playwright async browser context to open pages in
+        grant_details: List of grant detail dictionaries from get_grant_details()
+        max_depth: Maximum depth to recurse when following links (default: 4)
+        max_concurrency: Maximum number of pages loading at the same time
+
+    Returns:
+        Same list of dictionaries as deep_scrape_grants()
+    """
+    # (result node, depth, URLs visited for this grant, base domain)
+    pending: asyncio.Queue[tuple[dict[str, Any], int, set[str], str]] = asyncio.Queue()
+
+    def follow(
+        parent: list[dict[str, Any]],
+        url: str,
+        depth: int,
+        visited: set[str],
+        base_domain: str,
+    ) -> None:
+        # Checked and marked without awaiting in between, so no lock is needed
+        if url in visited:
+            parent.append(_new_deep_node(url, "Already visited (cycle prevention)"))
+            return
+        visited.add(url)
+        node = _new_deep_node(url)
+        parent.append(node)
+        pending.put_nowait((node, depth, visited, base_domain))
+
+    results = []
+    for grant in grant_details:
+        links = grant.get("links", [])
+        deep_content: list[dict[str, Any]] = []
+        results.append({**grant, "deep_content": deep_content})
+
+        parsed = urlparse(grant.get("url"))
+        base_domain = f"{parsed.scheme}://{parsed.netloc}"
+        visited: set[str] = set()
+        for link_url in links:
+            # Skip non-HTTP(S) links
+            if link_url.startswith(("http://", "https://")):
+                follow(deep_content, link_url, 0, visited, base_domain)
+
+    if pending.empty():
+        return results
+
+    async def worker(pool: PagePool) -> None:
+        while True:
+            node, depth, visited, base_domain = await pending.get()
+            try:
+                async with pool.lease() as page:
+                    page_data = await extract_page_content_and_links_async(
+                        page, node["url"]
+                    )
+                node["content"] = page_data["content"]
+                node["links"] = page_data["links"]
+                node["error"] = page_data["error"]
+
+                if depth >= max_depth:
+                    continue
+                for link_url in page_data["links"]:
+                    # Only follow HTTP(S) links on the grant's own domain
+                    parsed_link = urlparse(link_url)
+                    link_domain = f"{parsed_link.scheme}://{parsed_link.netloc}"
+                    if link_domain != base_domain or not link_url.startswith(
+                        ("http://", "https://")
+                    ):
+                        continue
+                    follow(
+                        node["nested_content"],
+                        link_url,
+                        depth + 1,
+                        visited,
+                        base_domain,
+                    )
+            except Exception as e:
+                node["error"] = str(e)
+                print(f"  Error deep scraping {node['url']}: {e}")
+            finally:
+                pending.task_done()
+
+    # No more pages than there are links to start from, so a grant with one
+    # link does not open a full pool; nested links share these pages
+    pool_size = min(max_concurrency, pending.qsize())
+    async with PagePool(context, pool_size) as pool:
+        workers = [asyncio.create_task(worker(pool)) for _ in range(pool_size)]
+        try:
+            await pending.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    return results
@@ -1,10 +1,20 @@
 """Service for downloading and converting files."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
 import requests
-from playwright.sync_api import Page
+
+# Maximum number of files downloaded at the same time for one grant
+MAX_DOWNLOAD_WORKERS = 10
+
+DOWNLOADABLE_EXTENSIONS = {".pdf", ".docx", ".doc", ".txt", ".md"}
+
+# LibreOffice refuses to run twice at once with the same user profile, so
+# conversions stay serial even when downloads run in parallel
+_convert_lock = threading.Lock()
 
 
 def download_file(url: str, output_path: Path) -> bool:
@@ -50,19 +60,20 @@ def convert_docx_to_pdf(docx_path: Path, pdf_path: Path) -> bool:
     try:
         pdf_path.parent.mkdir(parents=True, exist_ok=True)
         # Use LibreOffice to convert
-        result = subprocess.run(
-            [
-                "libreoffice",
-                "--headless",
-                "--convert-to",
-                "pdf",
-                "--outdir",
-                str(pdf_path.parent),
-                str(docx_path),
-            ],
-            capture_output=True,
-            timeout=60,
-        )
+        with _convert_lock:
+            result = subprocess.run(
+                [
+                    "libreoffice",
+                    "--headless",
+                    "--convert-to",
+                    "pdf",
+                    "--outdir",
+                    str(pdf_path.parent),
+                    str(docx_path),
+                ],
+                capture_output=True,
+                timeout=60,
+            )
 
         if result.returncode == 0:
             # LibreOffice creates PDF with same name but .pdf extension
@@ -128,13 +139,12 @@ def download_and_convert_file(
 
 
 def download_files_from_links(
-    page: Page, links: list[str], output_dir: Path, grant_id: int
+    links: list[str], output_dir: Path, grant_id: int
 ) -> list[Path]:
     """
     Download files from a list of URLs.
 
     Args:
-        page: Playwright page object (for handling redirects/auth)
         links: List of URLs to download
         output_dir: Directory to save files
         grant_id: ID of the grant
@@ -142,22 +152,34 @@ def download_files_from_links(
     Returns:
         List of paths to downloaded files
     """
-    downloaded_files = []
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    file_links = []
     for idx, link in enumerate(links):
         # Check if link is a file (PDF, DOCX, etc.)
         parsed = urlparse(link)
         path = parsed.path.lower()
         ext = Path(path).suffix.lower()
 
-        if ext in [".pdf", ".docx", ".doc", ".txt", ".md"]:
-            file_path = download_and_convert_file(link, output_dir, grant_id, idx)
-            if file_path:
-                downloaded_files.append(file_path)
+        if ext in DOWNLOADABLE_EXTENSIONS:
+            file_links.append((idx, link))
         else:
             # If not a direct file link, try to scrape the page for downloadable content
             # This is a fallback - you might want to enhance this
             print(f"Skipping non-file link: {link}")
 
-    return downloaded_files
+    if not file_links:
+        return []
+
+    # File links are plain HTTP downloads, so fetch them concurrently; results
+    # keep the order of the links
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_DOWNLOAD_WORKERS, len(file_links))
+    ) as executor:
+        file_paths = executor.map(
+            lambda item: download_and_convert_file(
+                item[1], output_dir, grant_id, item[0]
+            ),
+            file_links,
+        )
+        return [file_path for file_path in file_paths if file_path]
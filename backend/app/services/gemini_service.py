@@ -45,8 +45,20 @@ if not api_key:
 
 client = genai.Client(api_key=api_key)
 
-# The model to use
-GEMINI_MODEL = "gemini-3-pro-preview"
+# The models to use: a small, fast model for the Phase 1 relevance score and
+# the stronger model for Phase 2 (and borderline Phase 1 re-checks)
+PRELIM_MODEL = "gemini-flash-lite-latest"
+DEEP_MODEL = "gemini-3-pro-preview"
+
+# Structured output configs, built once and reused for every call
+_PRELIM_CFG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=GeminiPreliminaryAnalysis,
+)
+_DEEP_CFG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=GeminiDeepAnalysis,
+)
 
 # Rate limiting
 if GEMINI_BILLING_TIER == "FREE":
@@ -71,10 +83,12 @@ def analyze_grant_preliminary(
     grant_info: dict[str, Any],
     org_info: dict[str, Any],
     initiative_info: dict[str, Any],
+    model: str = PRELIM_MODEL,
 ) -> int:
     """
     Phase 1: Quick preliminary rating of grant relevance (0-100).
     Returns the rating as an integer.
+    Uses PRELIM_MODEL unless another model is given.
     Retries up to MAX_RETRIES times on failure.
     """
 
@@ -127,18 +141,18 @@ Return a JSON object with a single field 'rating' containing the integer score (
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             response = client.models.generate_content(
-                model=GEMINI_MODEL,
+                model=model,
                 contents=prompt,
-                config={
-                    "response_mime_type": "application/json",
-                    "response_json_schema": GeminiPreliminaryAnalysis.model_json_schema(),
-                },
+                config=_PRELIM_CFG,
             )
 
             logger.debug(
                 f"--- GEMINI RESPONSE (PRELIMINARY) ---\n{response.text}\n-------------------------------------"
             )
-            analysis = GeminiPreliminaryAnalysis.model_validate_json(response.text)
+            # The SDK has already validated the JSON against the schema
+            analysis = response.parsed
+            if analysis is None:
+                raise ValueError("Gemini response could not be parsed")
             return analysis.rating
 
         except Exception as e:
@@ -249,18 +263,18 @@ Consider both the organisation's broader mission AND the specific initiative's n
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             response = client.models.generate_content(
-                model=GEMINI_MODEL,
+                model=DEEP_MODEL,
                 contents=parts,
-                config={
-                    "response_mime_type": "application/json",
-                    "response_json_schema": GeminiDeepAnalysis.model_json_schema(),
-                },
+                config=_DEEP_CFG,
             )
 
             logger.debug(
                 f"--- GEMINI RESPONSE (DETAILED) ---\n{response.text}\n----------------------------------"
             )
-            analysis = GeminiDeepAnalysis.model_validate_json(response.text)
+            # The SDK has already validated the JSON against the schema
+            analysis = response.parsed
+            if analysis is None:
+                raise ValueError("Gemini response could not be parsed")
             return analysis
 
         except Exception as e:
@@ -1,9 +1,11 @@
 """Service for running the grant filtering pipeline."""
 
+import asyncio
 import logging
+import queue
+import threading
 from pathlib import Path
-
-from playwright.sync_api import sync_playwright
+from typing import Any
 
 from app.access import (
     GrantAccess,
@@ -14,13 +16,16 @@ from app.access import (
 )
 from app.models.gemini import gemini_to_sqlalchemy
 from app.models.models import Result
-from app.services.deep_scraper import deep_scrape_grants
+from app.services.deep_scraper import deep_scrape_grants_async
 from app.services.file_service import download_files_from_links
 from app.services.gemini_service import (
+    DEEP_MODEL,
     analyze_grant_detailed,
     analyze_grant_preliminary,
 )
 from app.services.pipeline_status import PipelinePhase, update_status
+from app.services.prefilter import PREFILTER_THRESHOLD, relevance_scores
+from app.services.scraper import BrowserPool
 
 logger = logging.getLogger(__name__)
 
@@ -36,282 +41,447 @@ DEEP_SCRAPE_DIR.mkdir(parents=True, exist_ok=True)
 # Threshold for filtering grants in Phase 2
 RATING_THRESHOLD = 61
 
+# Phase 1 ratings this close to the threshold are re-checked with DEEP_MODEL
+BORDERLINE_MARGIN = 3
 
-def run_pipeline(initiative_id: int, threshold: int = RATING_THRESHOLD) -> None:
+# How many scraped grants may wait for Gemini before the Phase 2 scraper pauses
+PHASE2_QUEUE_SIZE = 4
+
+# Marks the end of the Phase 2 scraper's output
+_PHASE2_DONE = object()
+
+
+def _grant_to_dict(grant) -> dict[str, Any]:
+    """Copy the fields the pipeline needs off a Grant ORM object."""
+    return {
+        "id": grant.id,
+        "name": grant.name,
+        "issuer": grant.issuer,
+        "url": grant.url,
+        "button_text": grant.button_text,
+        "card_body_text": grant.card_body_text,
+        "links": list(grant.links or []),
+    }
+
+
+def _grant_info(grant: dict[str, Any]) -> dict[str, Any]:
+    """Build the grant context passed to Gemini."""
+    return {
+        "id": grant["id"],
+        "name": grant["name"],
+        "issuer": grant["issuer"],
+        "url": grant["url"],
+        "card_body_text": grant["card_body_text"],
+    }
+
+
+def _load_context(
+    initiative_id: int,
+) -> tuple[dict[str, Any], dict[str, Any], list[dict[str, Any]]] | None:
     """
-    Run the complete grant filtering pipeline using standard Gemini API calls.
+    Load the organisation, initiative and grants as plain dicts.
+
+    The session is closed before returning so no connection is held while
+    Gemini is being called. Returns None (after setting the error status)
+    if anything required is missing.
+    """
+    with get_db_session() as db:
+        # Step 1: Read initiative and organization
+        logger.info(f"Loading initiative {initiative_id} and organization...")
+        initiative = InitiativeAccess.get_by_id(db, initiative_id)
+        if not initiative:
+            error_msg = f"Initiative {initiative_id} not found"
+            logger.error(error_msg)
+            update_status(initiative_id, PipelinePhase.ERROR, error=error_msg)
+            return None
+
+        org = OrganisationAccess.get_by_id(db, initiative.organisation_id)
+        if not org:
+            error_msg = f"Organization for initiative {initiative_id} not found"
+            logger.error(error_msg)
+            update_status(initiative_id, PipelinePhase.ERROR, error=error_msg)
+            return None
+
+        logger.info(f"Loaded organization: {org.name}")
+
+        # Context Dicts
+        org_info = {
+            "id": org.id,
+            "name": org.name,
+            "mission_and_focus": org.mission_and_focus,
+            "about_us": org.about_us,
+            "remarks": org.remarks,
+        }
+
+        initiative_info = {
+            "id": initiative.id,
+            "title": initiative.title,
+            "goals": initiative.goals,
+            "audience": initiative.audience,
+            "costs": initiative.costs,
+            "stage": initiative.stage,
+            "demographic": initiative.demographic,
+            "remarks": initiative.remarks,
+        }
+
+        # Step 2: Get all grants
+        logger.info("Loading all grants from database...")
+        grant_models = GrantAccess.get_all(db)
+        grants = [_grant_to_dict(grant) for grant in grant_models]
+        del grant_models
+        db.expunge_all()
+
+    if not grants:
+        error_msg = "No grants found in database"
+        logger.error(error_msg)
+        update_status(initiative_id, PipelinePhase.ERROR, error=error_msg)
+        return None
+
+    return org_info, initiative_info, grants
+
+
+def _phase1(
+    initiative_id: int,
+    grants: list[dict[str, Any]],
+    org_info: dict[str, Any],
+    initiative_info: dict[str, Any],
+    threshold: int,
+) -> dict[int, int]:
+    """
+    Phase 1: rate every grant. Returns {grant_id: rating}.
+
+    Grants with almost no keyword overlap with the initiative are rated 0
+    locally; only the rest are sent to Gemini. Ratings within
+    BORDERLINE_MARGIN of the threshold are re-rated with DEEP_MODEL.
+
+    Each rating is saved as soon as it is known, so a failure partway through
+    keeps the Gemini ratings already paid for.
     """
+    logger.info("Phase 1: Starting Preliminary Analysis...")
+
+    initiative_blob = (
+        f"{initiative_info.get('title') or ''}\n"
+        f"{initiative_info.get('goals') or ''}\n"
+        f"{org_info.get('mission_and_focus') or ''}"
+    )
+    scores = relevance_scores(
+        [f"{g['name']}\n{g['card_body_text'] or ''}" for g in grants],
+        initiative_blob,
+    )
+
+    ratings: dict[int, int] = {}
+    to_analyze = []
+    for grant, score in zip(grants, scores):
+        if score < PREFILTER_THRESHOLD:
+            ratings[grant["id"]] = 0
+        else:
+            to_analyze.append(grant)
+
     logger.info(
-        f"Starting pipeline for initiative {initiative_id} with threshold {threshold}"
+        f"Prefilter skipped {len(grants) - len(to_analyze)} of {len(grants)} grants"
+    )
+    _persist_prelim_ratings(initiative_id, ratings)
+    update_status(
+        initiative_id,
+        PipelinePhase.PHASE_1_CALCULATING,
+        remaining_calls=len(to_analyze),
     )
 
-    try:
-        with get_db_session() as db:
-            # Step 1: Read initiative and organization
-            logger.info(f"Loading initiative {initiative_id} and organization...")
-            initiative = InitiativeAccess.get_by_id(db, initiative_id)
-            if not initiative:
-                error_msg = f"Initiative {initiative_id} not found"
-                logger.error(error_msg)
-                update_status(initiative_id, PipelinePhase.ERROR, error=error_msg)
-                return
-
-            org = OrganisationAccess.get_by_id(db, initiative.organisation_id)
-            if not org:
-                error_msg = f"Organization for initiative {initiative_id} not found"
-                logger.error(error_msg)
-                update_status(initiative_id, PipelinePhase.ERROR, error=error_msg)
-                return
-
-            logger.info(f"Loaded organization: {org.name}")
-
-            # Context Dicts
-            org_info = {
-                "id": org.id,
-                "name": org.name,
-                "mission_and_focus": org.mission_and_focus,
-                "about_us": org.about_us,
-                "remarks": org.remarks,
-            }
-
-            initiative_info = {
-                "id": initiative.id,
-                "title": initiative.title,
-                "goals": initiative.goals,
-                "audience": initiative.audience,
-                "costs": initiative.costs,
-                "stage": initiative.stage,
-                "demographic": initiative.demographic,
-                "remarks": initiative.remarks,
-            }
-
-            # Step 2: Get all grants
-            logger.info("Loading all grants from database...")
-            grants = GrantAccess.get_all(db)
-            if not grants:
-                error_msg = "No grants found in database"
-                logger.error(error_msg)
-                update_status(initiative_id, PipelinePhase.ERROR, error=error_msg)
-                return
+    for idx, grant in enumerate(to_analyze):
+        logger.info(
+            f"Preliminary analysis {idx + 1}/{len(to_analyze)}: {grant['name']} (ID: {grant['id']})"
+        )
 
+        # Call Gemini API for preliminary rating
+        grant_info = _grant_info(grant)
+        prelim_rating = analyze_grant_preliminary(grant_info, org_info, initiative_info)
+        if abs(prelim_rating - threshold) <= BORDERLINE_MARGIN:
             logger.info(
-                f"Processing {len(grants)} grants for initiative {initiative_id}"
+                f"Grant {grant['id']} is borderline ({prelim_rating}), "
+                f"re-checking with {DEEP_MODEL}"
             )
-
-            # =================================================================
-            # Step 3: Phase 1 - Preliminary ratings (STANDARD API CALLS)
-            # =================================================================
-            logger.info("Phase 1: Starting Preliminary Analysis...")
-            update_status(
-                initiative_id,
-                PipelinePhase.PHASE_1_CALCULATING,
-                remaining_calls=len(grants),
+            prelim_rating = analyze_grant_preliminary(
+                grant_info, org_info, initiative_info, model=DEEP_MODEL
             )
+        ratings[grant["id"]] = prelim_rating
+        _persist_prelim_ratings(initiative_id, {grant["id"]: prelim_rating})
 
-            for idx, grant in enumerate(grants):
-                logger.info(
-                    f"Preliminary analysis {idx + 1}/{len(grants)}: {grant.name} (ID: {grant.id})"
-                )
-
-                grant_info_dict = {
-                    "id": grant.id,
-                    "name": grant.name,
-                    "issuer": grant.issuer,
-                    "url": grant.url,
-                    "card_body_text": grant.card_body_text,
-                }
+        logger.info(f"Grant {grant['id']} preliminary rating: {prelim_rating}")
 
-                # Call Gemini API for preliminary rating
-                prelim_rating = analyze_grant_preliminary(
-                    grant_info_dict, org_info, initiative_info
-                )
-
-                logger.info(f"Grant {grant.id} preliminary rating: {prelim_rating}")
+        # Update status
+        update_status(
+            initiative_id,
+            PipelinePhase.PHASE_1_CALCULATING,
+            remaining_calls=len(to_analyze) - idx - 1,
+            total_grants=len(to_analyze),
+            current_grant=idx + 1,
+        )
 
-                # Save/Update Result
-                result = ResultAccess.get_by_ids(db, grant.id, initiative_id)
-                if result:
-                    result.prelim_rating = prelim_rating
-                    ResultAccess.update(db, result)
-                else:
-                    result = Result(
-                        grant_id=grant.id,
+    return ratings
+
+
+def _persist_prelim_ratings(initiative_id: int, ratings: dict[int, int]) -> None:
+    """Save or update Phase 1 ratings in a single short session."""
+    if not ratings:
+        return
+    with get_db_session() as db:
+        for grant_id, prelim_rating in ratings.items():
+            result = ResultAccess.get_by_ids(db, grant_id, initiative_id)
+            if result:
+                result.prelim_rating = prelim_rating
+            else:
+                db.add(
+                    Result(
+                        grant_id=grant_id,
                         initiative_id=initiative_id,
                         prelim_rating=prelim_rating,
                     )
-                    ResultAccess.create(db, result)
-
-                # Update status
-                update_status(
-                    initiative_id,
-                    PipelinePhase.PHASE_1_CALCULATING,
-                    remaining_calls=len(grants) - idx - 1,
-                    total_grants=len(grants),
-                    current_grant=idx + 1,
                 )
 
-            logger.info("Phase 1 completed: All preliminary ratings saved.")
-            # =================================================================
 
-            # Step 4: Filter grants above threshold
-            logger.info(f"Filtering grants above threshold {threshold}...")
-            filtered_results = ResultAccess.get_filtered_by_rating(
+def _load_filtered_grants(initiative_id: int, threshold: int) -> list[dict[str, Any]]:
+    """Load the grants whose preliminary rating passed the threshold."""
+    with get_db_session() as db:
+        return [
+            _grant_to_dict(grant)
+            for grant in GrantAccess.get_filtered_by_prelim(
                 db, initiative_id, threshold
             )
+        ]
 
-            filtered_grant_ids = [r.grant_id for r in filtered_results]
-            filtered_grants = GrantAccess.get_by_ids(db, filtered_grant_ids)
 
-            logger.info(
-                f"Found {len(filtered_grants)} grants above threshold {threshold}"
-            )
+def _scrape_and_download(
+    filtered_grants: list[dict[str, Any]],
+    out_queue: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    """
+    Phase 2 producer: deep scrape each grant and download its files.
 
-            if not filtered_grants:
-                logger.info("No grants above threshold. Pipeline completed.")
-                update_status(
-                    initiative_id,
-                    PipelinePhase.COMPLETED,
-                    remaining_calls=0,
-                    total_grants=len(grants),
-                )
-                return
+    Runs in its own thread with its own event loop and puts
+    (grant, downloaded_files) on out_queue as each grant finishes. The pages
+    linked from one grant are deep scraped concurrently. Any exception is put
+    on the queue, followed by _PHASE2_DONE. Stops early once `stop` is set.
+    """
 
-            # Step 5: Phase 2 - Deep scraping
-            logger.info("Phase 2: Starting deep scraping...")
-            update_status(
-                initiative_id,
-                PipelinePhase.PHASE_2_DEEP_SCRAPING,
-                remaining_calls=len(filtered_grants),
-                total_grants=len(filtered_grants),
-            )
+    async def scrape_all() -> None:
+        # One browser and context serve every grant, so Chromium starts once
+        # and cookies/HTTP cache carry over
+        async with BrowserPool(headless=True) as browser_pool:
+            for grant in filtered_grants:
+                if stop.is_set():
+                    break
+
+                # Convert grant to dict format for deep scraper
+                grant_dict = {
+                    "url": grant["url"],
+                    "button_text": grant["button_text"] or grant["name"],
+                    "card_body_text": grant["card_body_text"],
+                    "links": grant["links"],
+                }
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                # Convert grants to dict format for deep scraper
-                grant_dicts = []
-                for grant in filtered_grants:
-                    grant_dicts.append(
-                        {
-                            "url": grant.url,
-                            "button_text": grant.button_text or grant.name,
-                            "card_body_text": grant.card_body_text,
-                            "links": grant.links or [],
-                        }
+                logger.info(f"Deep scraping grant {grant['id']} (max_depth=2)...")
+                deep_data = (
+                    await deep_scrape_grants_async(
+                        browser_pool.context, [grant_dict], max_depth=2
                     )
+                )[0]
 
-                # Deep scrape
-                logger.info(f"Deep scraping {len(grant_dicts)} grants (max_depth=2)...")
-                deep_scraped = deep_scrape_grants(page, grant_dicts, max_depth=2)
+                # Download files to deep_scrape/grant_{id}/ directory
+                grant_dir = DEEP_SCRAPE_DIR / f"grant_{grant['id']}"
+                grant_dir.mkdir(parents=True, exist_ok=True)
 
-                browser.close()
+                # Get links from deep scraped data
+                all_links = deep_data.get("links", [])
+                # Also get links from nested content
+                for nested in deep_data.get("deep_content", []):
+                    all_links.extend(nested.get("links", []))
 
-            logger.info("Phase 2: Deep scraping completed")
+                logger.debug(
+                    f"Downloading {len(all_links)} files for grant {grant['id']}..."
+                )
 
-            # Step 6: Download files and analyze with Gemini
-            logger.info("Phase 2: Starting detailed analysis with Gemini...")
-            update_status(
-                initiative_id,
-                PipelinePhase.PHASE_2_ANALYZING,
-                remaining_calls=len(filtered_grants),
-                total_grants=len(filtered_grants),
+                # Download files (converts docx to pdf automatically)
+                downloaded_files = await asyncio.to_thread(
+                    download_files_from_links, all_links, grant_dir, grant["id"]
+                )
+
+                logger.debug(f"Downloaded {len(downloaded_files)} files")
+
+                # Blocks while the analysis side is behind, so keep it off
+                # the event loop
+                await asyncio.to_thread(out_queue.put, (grant, downloaded_files))
+
+    try:
+        asyncio.run(scrape_all())
+        logger.info("Phase 2: Deep scraping completed")
+    except Exception as e:
+        out_queue.put(e)
+    finally:
+        out_queue.put(_PHASE2_DONE)
+
+
+def _phase2(
+    initiative_id: int,
+    filtered_grants: list[dict[str, Any]],
+    ratings: dict[int, int],
+    org_info: dict[str, Any],
+    initiative_info: dict[str, Any],
+) -> list[Result]:
+    """
+    Phase 2: deep scrape, download files and run detailed analysis.
+
+    Scraping runs in a producer thread while this thread sends each grant to
+    Gemini as soon as its files are ready, so the two stages overlap. Each
+    Result is saved as soon as its analysis completes.
+    """
+    logger.info("Phase 2: Starting deep scraping...")
+    update_status(
+        initiative_id,
+        PipelinePhase.PHASE_2_DEEP_SCRAPING,
+        remaining_calls=len(filtered_grants),
+        total_grants=len(filtered_grants),
+    )
+
+    scraped: queue.Queue = queue.Queue(maxsize=PHASE2_QUEUE_SIZE)
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_scrape_and_download,
+        args=(filtered_grants, scraped, stop),
+        name=f"phase2-scraper-{initiative_id}",
+        daemon=True,
+    )
+    producer.start()
+
+    results = []
+    idx = 0
+    try:
+        while (item := scraped.get()) is not _PHASE2_DONE:
+            if isinstance(item, Exception):
+                raise item
+
+            grant, downloaded_files = item
+            if idx == 0:
+                logger.info("Phase 2: Starting detailed analysis with Gemini...")
+
+            logger.info(
+                f"Analyzing grant {idx + 1}/{len(filtered_grants)}: "
+                f"{grant['name']} (ID: {grant['id']})"
             )
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+            # Preliminary rating was computed in Phase 1
+            prelim_rating = ratings.get(grant["id"], 50)
 
-                for idx, (grant, deep_data) in enumerate(
-                    zip(filtered_grants, deep_scraped)
-                ):
-                    logger.info(
-                        f"Analyzing grant {idx + 1}/{len(filtered_grants)}: "
-                        f"{grant.name} (ID: {grant.id})"
-                    )
+            logger.debug(
+                f"Sending grant {grant['id']} to Gemini for detailed analysis..."
+            )
 
-                    # Download files to deep_scrape/grant_{id}/ directory
-                    grant_dir = DEEP_SCRAPE_DIR / f"grant_{grant.id}"
-                    grant_dir.mkdir(parents=True, exist_ok=True)
+            # Analyze with Gemini (with files)
+            gemini_result = analyze_grant_detailed(
+                _grant_info(grant),
+                org_info,
+                initiative_info,
+                file_paths=downloaded_files if downloaded_files else None,
+            )
 
-                    # Get links from deep scraped data
-                    all_links = deep_data.get("links", [])
-                    # Also get links from nested content
-                    for nested in deep_data.get("deep_content", []):
-                        all_links.extend(nested.get("links", []))
+            # Convert to Result
+            result_obj = gemini_to_sqlalchemy(
+                gemini_result, grant["id"], initiative_id, prelim_rating
+            )
+            # Save right away so a later failure doesn't lose this analysis
+            _persist_results([result_obj])
+            results.append(result_obj)
 
-                    logger.debug(
-                        f"Downloading {len(all_links)} files for grant {grant.id}..."
-                    )
+            logger.info(
+                f"Completed analysis for grant {grant['id']}: "
+                f"Match Rating: {result_obj.match_rating}%, "
+                f"Uncertainty: {result_obj.uncertainty_rating}%"
+            )
 
-                    # Download files (converts docx to pdf automatically)
-                    downloaded_files = download_files_from_links(
-                        page, all_links, grant_dir, grant.id
-                    )
+            # Update status
+            idx += 1
+            update_status(
+                initiative_id,
+                PipelinePhase.PHASE_2_ANALYZING,
+                remaining_calls=len(filtered_grants) - idx,
+                total_grants=len(filtered_grants),
+                current_grant=idx,
+            )
+    finally:
+        # Unblock the producer if we stopped consuming early
+        stop.set()
+        while producer.is_alive():
+            try:
+                scraped.get(timeout=1)
+            except queue.Empty:
+                pass
 
-                    logger.debug(f"Downloaded {len(downloaded_files)} files")
+    return results
 
-                    # Prepare grant info
-                    grant_info = {
-                        "id": grant.id,
-                        "name": grant.name,
-                        "issuer": grant.issuer,
-                        "url": grant.url,
-                        "card_body_text": grant.card_body_text,
-                    }
 
-                    # Get preliminary rating (Already in DB from Phase 1)
-                    result = ResultAccess.get_by_ids(db, grant.id, initiative_id)
-                    prelim_rating = result.prelim_rating if result else 50
+def _persist_results(results: list[Result]) -> None:
+    """Create or update Phase 2 results in a single short session."""
+    with get_db_session() as db:
+        for result_obj in results:
+            ResultAccess.create_or_update(db, result_obj)
 
-                    logger.debug(
-                        f"Sending grant {grant.id} to Gemini for detailed analysis..."
-                    )
 
-                    # Analyze with Gemini (with files)
-                    gemini_result = analyze_grant_detailed(
-                        grant_info,
-                        org_info,
-                        initiative_info,
-                        file_paths=downloaded_files if downloaded_files else None,
-                    )
+def run_pipeline(initiative_id: int, threshold: int = RATING_THRESHOLD) -> None:
+    """
+    Run the complete grant filtering pipeline using standard Gemini API calls.
 
-                    # Convert to Result and save
-                    result_obj = gemini_to_sqlalchemy(
-                        gemini_result, grant.id, initiative_id, prelim_rating
-                    )
+    Database sessions are only held while loading or saving data, never
+    across the (slow) Gemini and scraping phases.
+    """
+    logger.info(
+        f"Starting pipeline for initiative {initiative_id} with threshold {threshold}"
+    )
 
-                    # Update or create result
-                    ResultAccess.create_or_update(db, result_obj)
+    try:
+        context = _load_context(initiative_id)
+        if context is None:
+            return
+        org_info, initiative_info, grants = context
 
-                    logger.info(
-                        f"Completed analysis for grant {grant.id}: "
-                        f"Match Rating: {result_obj.match_rating}%, "
-                        f"Uncertainty: {result_obj.uncertainty_rating}%"
-                    )
+        logger.info(f"Processing {len(grants)} grants for initiative {initiative_id}")
 
-                    # Update status
-                    update_status(
-                        initiative_id,
-                        PipelinePhase.PHASE_2_ANALYZING,
-                        remaining_calls=len(filtered_grants) - idx - 1,
-                        total_grants=len(filtered_grants),
-                        current_grant=idx + 1,
-                    )
+        # =================================================================
+        # Step 3: Phase 1 - Preliminary ratings (STANDARD API CALLS)
+        # =================================================================
+        ratings = _phase1(initiative_id, grants, org_info, initiative_info, threshold)
+        logger.info("Phase 1 completed: All preliminary ratings saved.")
+        # =================================================================
 
-                browser.close()
+        # Step 4: Filter grants above threshold
+        logger.info(f"Filtering grants above threshold {threshold}...")
+        filtered_grants = _load_filtered_grants(initiative_id, threshold)
 
-            # Step 7: Mark as completed
-            logger.info(
-                f"Pipeline completed successfully for initiative {initiative_id}. "
-                f"Processed {len(grants)} total grants, analyzed {len(filtered_grants)} in detail."
-            )
+        logger.info(f"Found {len(filtered_grants)} grants above threshold {threshold}")
+
+        if not filtered_grants:
+            logger.info("No grants above threshold. Pipeline completed.")
             update_status(
                 initiative_id,
                 PipelinePhase.COMPLETED,
                 remaining_calls=0,
                 total_grants=len(grants),
             )
+            return
+
+        # Step 5-6: Phase 2 - Deep scraping and detailed analysis
+        _phase2(initiative_id, filtered_grants, ratings, org_info, initiative_info)
+
+        # Step 7: Mark as completed
+        logger.info(
+            f"Pipeline completed successfully for initiative {initiative_id}. "
+            f"Processed {len(grants)} total grants, analyzed {len(filtered_grants)} in detail."
+        )
+        update_status(
+            initiative_id,
+            PipelinePhase.COMPLETED,
+            remaining_calls=0,
+            total_grants=len(grants),
+        )
 
     except Exception as e:
         # Logs the full stack trace automatically via exc_info=True
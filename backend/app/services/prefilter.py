@@ -0,0 +1,81 @@
+"""Cheap local relevance scoring used to skip obviously off-topic grants."""
+
+import math
+import re
+from collections import Counter
+
+# Grants scoring below this cosine similarity are not sent to Gemini
+PREFILTER_THRESHOLD = 0.05
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9]+")
+
+# Small English stop word list; enough to stop filler words dominating scores
+_STOP_WORDS = frozenset(
+    """
+    a about above after again all also am an and any are as at be because been
+    before being below between both but by can could did do does doing down
+    during each etc few for from further had has have having he her here hers
+    him his how i if in into is it its itself just may me more most must my no
+    nor not of off on once only or other our ours out over own per same she
+    should so some such than that the their theirs them then there these they
+    this those through to too under until up upon us very via was we were what
+    when where which while who whom why will with within without would you your
+    """.split()
+)
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase and split text into word tokens, dropping stop words."""
+    return [
+        token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOP_WORDS
+    ]
+
+
+def relevance_scores(documents: list[str], query: str) -> list[float]:
+    """
+    Score each document against the query using TF-IDF cosine similarity.
+
+    IDF is computed over the documents plus the query, so terms that appear
+    in every grant (boilerplate) carry little weight.
+
+    Args:
+        documents: Texts to score (e.g. grant details)
+        query: Text describing what is relevant (e.g. initiative goals)
+
+    Returns:
+        One score in [0, 1] per document, in the same order
+    """
+    doc_counts = [Counter(_tokenize(doc)) for doc in documents]
+    query_counts = Counter(_tokenize(query))
+
+    n_docs = len(doc_counts) + 1
+    doc_freq: Counter[str] = Counter()
+    for counts in doc_counts:
+        doc_freq.update(counts.keys())
+    doc_freq.update(query_counts.keys())
+
+    # Smoothed IDF, as in sklearn's TfidfVectorizer(smooth_idf=True)
+    idf = {term: math.log((1 + n_docs) / (1 + df)) + 1 for term, df in doc_freq.items()}
+
+    def weigh(counts: Counter[str]) -> tuple[dict[str, float], float]:
+        weights = {term: tf * idf[term] for term, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        return weights, norm
+
+    query_weights, query_norm = weigh(query_counts)
+    if not query_norm:
+        return [0.0] * len(doc_counts)
+
+    scores = []
+    for counts in doc_counts:
+        weights, norm = weigh(counts)
+        if not norm:
+            scores.append(0.0)
+            continue
+        dot = sum(
+            weight * query_weights[term]
+            for term, weight in weights.items()
+            if term in query_weights
+        )
+        scores.append(dot / (norm * query_norm))
+    return scores
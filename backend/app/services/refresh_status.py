@@ -1,15 +1,88 @@
 """Status tracking for grant refresh operations."""
 
+import json
+import os
+import threading
+import time
 import uuid
-from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
-# Global status storage (in production, use Redis or database)
+# Redis connection URL; when unset, statuses are kept in process memory
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Statuses expire from Redis a day after their last update
+STATUS_TTL_SECONDS = 24 * 60 * 60
+
+# In-memory fallback storage, only used when REDIS_URL is not set
 _refresh_status: dict[str, dict[str, Any]] = {}
+_refresh_status_lock = threading.Lock()
+
+# Per-grant progress ticks are written at most this often, unless the tick
+# lands on a multiple of PROGRESS_WRITE_EVERY or is the last grant
+PROGRESS_WRITE_INTERVAL = 0.25
+PROGRESS_WRITE_EVERY = 5
+
+# job_id -> (monotonic time, phase) of the last status write
+_last_write: dict[str, tuple[float, str]] = {}
+
+# (epoch second, formatted UTC timestamp) of the last formatted timestamp
+_ts_cache: tuple[int, str] = (0, "")
+
+
+class RedisStatusStore:
+    """Refresh job statuses stored as Redis hashes, one hash per job.
+
+    Field values are JSON-encoded so ints and lists survive the round-trip.
+    """
+
+    def __init__(self, url: str):
+        import redis
+
+        self._redis = redis.Redis.from_url(url, decode_responses=True)
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"refresh:{job_id}"
+
+    @staticmethod
+    def _encode(fields: dict[str, Any]) -> dict[str, str]:
+        return {field: json.dumps(value) for field, value in fields.items()}
 
+    def set(self, job_id: str, status: dict[str, Any]) -> None:
+        """Replace the whole status of a job."""
+        key = self._key(job_id)
+        pipe = self._redis.pipeline()
+        pipe.delete(key)
+        pipe.hset(key, mapping=self._encode(status))
+        pipe.expire(key, STATUS_TTL_SECONDS)
+        pipe.execute()
 
-class RefreshPhase(Enum):
+    def update(self, job_id: str, fields: dict[str, Any]) -> None:
+        """Merge fields into the status of a job, leaving other fields as-is."""
+        key = self._key(job_id)
+        # HSET is atomic on its own; the pipeline only saves a round-trip
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hset(key, mapping=self._encode(fields))
+        pipe.expire(key, STATUS_TTL_SECONDS)
+        pipe.execute()
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Get the status of a job, or None if it does not exist."""
+        raw = self._redis.hgetall(self._key(job_id))
+        if not raw:
+            return None
+        return {field: json.loads(value) for field, value in raw.items()}
+
+    def delete(self, job_id: str) -> None:
+        """Delete the status of a job."""
+        self._redis.delete(self._key(job_id))
+
+
+_redis_store = RedisStatusStore(REDIS_URL) if REDIS_URL else None
+
+
+class RefreshPhase(StrEnum):
     """Refresh operation phases."""
 
     IDLE = "idle"
@@ -22,6 +95,19 @@ class RefreshPhase(Enum):
     ERROR = "error"
 
 
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO 8601 string, at one-second resolution.
+
+    Status updates arrive many times per second, so the formatted string is
+    cached and only rebuilt when the second changes.
+    """
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)))
+    return _ts_cache[1]
+
+
 def create_job_id() -> str:
     """Generate a unique job ID for a refresh operation."""
     return str(uuid.uuid4())
@@ -29,12 +115,20 @@ def create_job_id() -> str:
 
 def set_refresh_status(job_id: str, status: dict[str, Any]) -> None:
     """Set status for a refresh job."""
+    if _redis_store is not None:
+        _redis_store.set(job_id, status)
+        return
     _refresh_status[job_id] = status
 
 
 def get_refresh_status(job_id: str) -> dict[str, Any] | None:
     """Get status for a refresh job."""
-    return _refresh_status.get(job_id)
+    if _redis_store is not None:
+        return _redis_store.get(job_id)
+    # Return a copy so callers never see a half-applied update
+    with _refresh_status_lock:
+        status = _refresh_status.get(job_id)
+        return dict(status) if status is not None else None
 
 
 def update_refresh_status(
@@ -46,14 +140,35 @@ def update_refresh_status(
     message: str | None = None,
     error: str | None = None,
 ) -> None:
-    """Update refresh job status."""
-    status = _refresh_status.get(job_id, {})
+    """Update refresh job status.
+
+    Progress ticks that only move current_grant within the same phase are
+    coalesced, so polling clients see at most a few writes per second.
+    """
+    now = time.monotonic()
+    last = _last_write.get(job_id)
+    if (
+        current_grant is not None
+        and grants_saved is None
+        and error is None
+        and last is not None
+        and last[1] == phase
+        and now - last[0] < PROGRESS_WRITE_INTERVAL
+        and current_grant % PROGRESS_WRITE_EVERY != 0
+        and current_grant != total_found
+    ):
+        return
+    if phase in (RefreshPhase.COMPLETED, RefreshPhase.ERROR):
+        # No more progress ticks will follow, so drop the throttle state
+        _last_write.pop(job_id, None)
+    else:
+        _last_write[job_id] = (now, phase)
 
     # Build update dict with only non-None values to preserve existing data
     updates = {
         "job_id": job_id,
-        "phase": phase.value,
-        "updated_at": datetime.utcnow().isoformat(),
+        "phase": phase,
+        "updated_at": _utcnow_iso(),
     }
     
     # Only update fields that are explicitly provided (not None)
@@ -68,8 +183,15 @@ def update_refresh_status(
     if error is not None:
         updates["error"] = error
 
-    status.update(updates)
-    set_refresh_status(job_id, status)
+    if _redis_store is not None:
+        # Redis hashes merge on HSET, so there is no need to read first
+        _redis_store.update(job_id, updates)
+        return
+
+    # The scraper thread and the request handlers share this dict, so merge
+    # under the lock to avoid losing concurrent updates
+    with _refresh_status_lock:
+        _refresh_status.setdefault(job_id, {}).update(updates)
 
 
 def complete_refresh(
@@ -82,17 +204,21 @@ def complete_refresh(
     """Mark refresh job as completed."""
     status = {
         "job_id": job_id,
-        "phase": RefreshPhase.COMPLETED.value,
+        "phase": RefreshPhase.COMPLETED,
         "total_found": total_found,
         "grants_saved": grants_saved,
         "grant_urls": grant_urls,
         "errors": errors,
-        "completed_at": datetime.utcnow().isoformat(),
+        "completed_at": _utcnow_iso(),
     }
     set_refresh_status(job_id, status)
+    _last_write.pop(job_id, None)
 
 
 def clear_refresh_status(job_id: str) -> None:
     """Clear status for a refresh job."""
-    if job_id in _refresh_status:
-        del _refresh_status[job_id]
+    _last_write.pop(job_id, None)
+    if _redis_store is not None:
+        _redis_store.delete(job_id)
+        return
+    _refresh_status.pop(job_id, None)
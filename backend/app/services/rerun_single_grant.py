@@ -3,7 +3,7 @@
 import logging
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Page, sync_playwright
 
 from app.access import (
     GrantAccess,
@@ -27,11 +27,50 @@ logger = logging.getLogger(__name__)
 BASE_DIR = Path(__file__).parent
 DOWNLOADS_DIR = BASE_DIR / "downloads"
 DEEP_SCRAPE_DIR = DOWNLOADS_DIR / "deep_scrape"
+# Persistent browser profile so the HTTP cache survives across runs. Kept
+# under backend/downloads with the pipeline's files, not in the source tree.
+BROWSER_PROFILE_DIR = (
+    Path(__file__).parent.parent.parent / "downloads" / "browser_profile"
+)
 
 DEEP_SCRAPE_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def rerun_grant_analysis(grant_id: int, initiative_id: int, phase: str = "both"):
+def _deep_scrape_and_download(page: Page, grant, grant_id: int) -> list[Path]:
+    """Deep scrape a grant and download the files it links to."""
+    grant_dict = {
+        "url": grant.url,
+        "button_text": grant.button_text or grant.name,
+        "card_body_text": grant.card_body_text,
+        "links": grant.links or [],
+    }
+
+    logger.info("Deep scraping grant...")
+    deep_scraped = deep_scrape_grants(page, [grant_dict], max_depth=2)
+    deep_data = deep_scraped[0] if deep_scraped else {}
+
+    # Download files
+    grant_dir = DEEP_SCRAPE_DIR / f"grant_{grant_id}"
+    grant_dir.mkdir(parents=True, exist_ok=True)
+
+    all_links = deep_data.get("links", [])
+    for nested in deep_data.get("deep_content", []):
+        all_links.extend(nested.get("links", []))
+
+    logger.info(f"Downloading {len(all_links)} files...")
+    downloaded_files = download_files_from_links(all_links, grant_dir, grant_id)
+
+    logger.info(f"Downloaded {len(downloaded_files)} files")
+    return downloaded_files
+
+
+def rerun_grant_analysis(
+    grant_id: int,
+    initiative_id: int,
+    phase: str = "both",
+    *,
+    page: Page | None = None,
+):
     """
     Re-run analysis for a specific grant.
 
@@ -39,6 +78,10 @@ def rerun_grant_analysis(grant_id: int, initiative_id: int, phase: str = "both")
         grant_id: ID of the grant to analyze
         initiative_id: ID of the initiative to analyze against
         phase: "preliminary", "detailed", or "both" (default: "both")
+        page: Optional Playwright page to reuse for the detailed phase. When
+            re-running several grants, pass one page to avoid launching a
+            browser per grant. If omitted, a browser is launched and closed
+            here.
     """
     logger.info(
         f"Re-running analysis for grant {grant_id} and initiative {initiative_id}"
@@ -122,61 +165,42 @@ def rerun_grant_analysis(grant_id: int, initiative_id: int, phase: str = "both")
                 result = ResultAccess.get_by_ids(db, grant_id, initiative_id)
                 prelim_rating = result.prelim_rating if result else 50
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                # Deep scrape
-                grant_dict = {
-                    "url": grant.url,
-                    "button_text": grant.button_text or grant.name,
-                    "card_body_text": grant.card_body_text,
-                    "links": grant.links or [],
-                }
-
-                logger.info("Deep scraping grant...")
-                deep_scraped = deep_scrape_grants(page, [grant_dict], max_depth=2)
-                deep_data = deep_scraped[0] if deep_scraped else {}
-
-                # Download files
-                grant_dir = DEEP_SCRAPE_DIR / f"grant_{grant_id}"
-                grant_dir.mkdir(parents=True, exist_ok=True)
-
-                all_links = deep_data.get("links", [])
-                for nested in deep_data.get("deep_content", []):
-                    all_links.extend(nested.get("links", []))
-
-                logger.info(f"Downloading {len(all_links)} files...")
-                downloaded_files = download_files_from_links(
-                    page, all_links, grant_dir, grant_id
-                )
-
-                logger.info(f"Downloaded {len(downloaded_files)} files")
-
-                # Analyze with Gemini
-                logger.info("Analyzing with Gemini...")
-                gemini_result = analyze_grant_detailed(
-                    grant_info,
-                    org_info,
-                    initiative_info,
-                    file_paths=downloaded_files if downloaded_files else None,
-                )
-
-                # Save to database
-                result_obj = gemini_to_sqlalchemy(
-                    gemini_result, grant_id, initiative_id, prelim_rating
-                )
-                ResultAccess.create_or_update(db, result_obj)
-
-                logger.info(
-                    f"Detailed analysis complete:\n"
-                    f"  Match Rating: {result_obj.match_rating}%\n"
-                    f"  Uncertainty: {result_obj.uncertainty_rating}%\n"
-                    f"  Grant Amount: {result_obj.grant_amount}\n"
-                    f"  Deadline: {result_obj.deadline}"
-                )
+            if page is not None:
+                downloaded_files = _deep_scrape_and_download(page, grant, grant_id)
+            else:
+                with sync_playwright() as p:
+                    context = p.chromium.launch_persistent_context(
+                        str(BROWSER_PROFILE_DIR), headless=True
+                    )
+                    try:
+                        downloaded_files = _deep_scrape_and_download(
+                            context.new_page(), grant, grant_id
+                        )
+                    finally:
+                        context.close()
+
+            # Analyze with Gemini
+            logger.info("Analyzing with Gemini...")
+            gemini_result = analyze_grant_detailed(
+                grant_info,
+                org_info,
+                initiative_info,
+                file_paths=downloaded_files if downloaded_files else None,
+            )
 
-                browser.close()
+            # Save to database
+            result_obj = gemini_to_sqlalchemy(
+                gemini_result, grant_id, initiative_id, prelim_rating
+            )
+            ResultAccess.create_or_update(db, result_obj)
+
+            logger.info(
+                f"Detailed analysis complete:\n"
+                f"  Match Rating: {result_obj.match_rating}%\n"
+                f"  Uncertainty: {result_obj.uncertainty_rating}%\n"
+                f"  Grant Amount: {result_obj.grant_amount}\n"
+                f"  Deadline: {result_obj.deadline}"
+            )
 
         logger.info(f"Successfully completed re-analysis for grant {grant_id}")
 
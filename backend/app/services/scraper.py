@@ -1,16 +1,149 @@
+import asyncio
 import logging
+import os
+import re
+import warnings
+from collections import Counter
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
-from playwright.sync_api import Page, sync_playwright
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.async_api import Page as AsyncPage
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+from playwright.sync_api import Page
 
 if TYPE_CHECKING:
     from models.models import Grant
 
 logger = logging.getLogger(__name__)
 
+# Number of grant detail pages scraped at the same time
+DEFAULT_MAX_CONCURRENCY = 5
+
+# Grant listing hrefs are resolved against this origin
+GRANTS_BASE_URL = "https://oursggrants.gov.sg"
+
+# Debug screenshots are only ever written when SCRAPER_DEBUG=1
+SCRAPER_DEBUG = os.getenv("SCRAPER_DEBUG") == "1"
+
+# CSS selectors for the grants portal, defined once and passed into the page
+# scripts below rather than repeated in every query
+GRANT_CARD_SELECTOR = '[class*="itemsContainer"]'
+CLOSED_GRANT_SELECTOR = '[class*="closedGrant"]'
+CLOSING_STATUS_SELECTOR = "#closingDates span"
+VIEW_DETAILS_SELECTOR = '[class*="viewDetailsButton"]'
+ORGANISATION_FILTER_SELECTOR = "#applyAs-1"
+ORGANISATION_FILTER_LABEL_SELECTOR = 'label[for="applyAs-1"]'
+CARD_BODY_SELECTOR = ".card-body"
+ISSUER_SELECTOR = ".card-title h2"
+TITLE_SELECTOR = "#grant-header"
+
+# Status text marking a closed grant. _GET_LINKS_JS tests the same pattern
+# case-insensitively in the page, and _iter_open_grants re-checks the status
+# text of the cards it returns.
+APPS_CLOSED_RE = re.compile(r"Applications closed", re.IGNORECASE)
+
+_SELECTORS = {
+    "grantCard": GRANT_CARD_SELECTOR,
+    "closedGrant": CLOSED_GRANT_SELECTOR,
+    "closingStatus": CLOSING_STATUS_SELECTOR,
+    "viewDetails": VIEW_DETAILS_SELECTOR,
+    "cardBody": CARD_BODY_SELECTOR,
+    "issuer": ISSUER_SELECTOR,
+    "title": TITLE_SELECTOR,
+    "appsClosed": APPS_CLOSED_RE.pattern,
+}
+
+
+# Collects closed state, status text, link and button text for every grant
+# card on the listing page in a single evaluate call
+_GET_LINKS_JS = """
+(sel) => {
+    const cards = Array.from(document.querySelectorAll(sel.grantCard));
+    const appsClosed = new RegExp(sel.appsClosed, "i");
+    return {
+        total: cards.length,
+        cards: cards.map((card, index) => {
+            if (card.querySelector(sel.closedGrant)) {
+                return { index, closed: true };
+            }
+            const status = card.querySelector(sel.closingStatus)?.textContent || "";
+            if (appsClosed.test(status)) {
+                return { index, closed: true };
+            }
+            const link = card.querySelector("a[href]");
+            const button = card.querySelector(sel.viewDetails);
+            return {
+                index,
+                closed: false,
+                status,
+                href: link ? link.getAttribute("href") : null,
+                button_text: button ? button.textContent : null,
+            };
+        }),
+    };
+}
+"""
+
+
+def _absolute_links(hrefs: list[str | None], url: str) -> list[str]:
+    """Convert hrefs found on the page at url to absolute URLs, skipping empty ones.
+
+    Root-relative hrefs (the common case on the grants portal) are joined to
+    the page's scheme and host directly; only other relative forms go through
+    urljoin.
+    """
+    base = urlsplit(url)
+    base_prefix = f"{base.scheme}://{base.netloc}"
+    links = []
+    for href in hrefs:
+        if not href:
+            continue
+        if href.startswith("http"):
+            links.append(href)
+        elif href.startswith("/") and not href.startswith("//"):
+            links.append(base_prefix + href)
+        else:
+            links.append(urljoin(url, href))
+    return links
+
+
+def _iter_open_grants(result: dict) -> Iterator[dict[str, str]]:
+    """Yield open grant links from the result of _GET_LINKS_JS."""
+    total_cards = result["total"]
+
+    logger.debug(f"Found {total_cards} grant cards on page")
+
+    open_grants = 0
+    for card in result["cards"]:
+        if card["closed"] or APPS_CLOSED_RE.search(card["status"]):
+            logger.debug(f"Skipping closed grant (card {card['index'] + 1})")
+            continue
+
+        href = card["href"]
+        button_text = card["button_text"]
+        if href:
+            # Construct full URL if relative
+            if href.startswith("http"):
+                full_url = href
+            elif href.startswith("/"):
+                full_url = GRANTS_BASE_URL + href
+            else:
+                full_url = f"{GRANTS_BASE_URL}/{href}"
+            logger.debug(f"Found open grant: {button_text}")
+            open_grants += 1
+            yield {
+                "url": full_url,
+                "button_text": button_text.strip() if button_text else None,
+            }
+
+    logger.info(f"Extracted {open_grants} open grants from {total_cards} total cards")
+
 
 def get_links(page: Page) -> list[dict[str, str]]:
     """Extract links for open grants from the grants listing page.
@@ -21,66 +154,47 @@ def get_links(page: Page) -> list[dict[str, str]]:
     Returns:
         List of dictionaries with 'url' and 'button_text' keys
     """
-    grant_links = []
-    grant_cards = page.locator('[class*="itemsContainer"]')
-    total_cards = grant_cards.count()
+    # Run the whole extraction in the page so it costs one round-trip instead
+    # of several locator calls per card.
+    # Grants are closed if they have either:
+    # 1. A "Closed" div with class containing "closedGrant"
+    # 2. Text "Applications closed" in the status section
+    return list(_iter_open_grants(page.evaluate(_GET_LINKS_JS, _SELECTORS)))
 
-    logger.debug(f"Found {total_cards} grant cards on page")
 
-    for i in range(total_cards):
-        card = grant_cards.nth(i)
-
-        # Check if the grant is closed
-        # Grants are closed if they have either:
-        # 1. A "Closed" div with class containing "closedGrant"
-        # 2. Text "Applications closed" in the status section
-        is_closed = False
-
-        # Check for "Closed" div
-        closed_div = card.locator('[class*="closedGrant"]')
-        if closed_div.count() > 0:
-            is_closed = True
-
-        # Check for "Applications closed" text with red styling
-        if not is_closed:
-            status_text = card.locator("#closingDates span").text_content()
-            if status_text and "Applications closed" in status_text:
-                is_closed = True
-
-        # If grant is not closed, extract the link
-        if not is_closed:
-            link_element = card.locator("a[href]")
-            if link_element.count() > 0:
-                href = link_element.get_attribute("href")
-                button_text = card.locator(
-                    '[class*="viewDetailsButton"]'
-                ).text_content()
-                if href:
-                    # Construct full URL if relative
-                    full_url = (
-                        href
-                        if href.startswith("http")
-                        else f"https://oursggrants.gov.sg{href}"
-                    )
-                    grant_links.append(
-                        {
-                            "url": full_url,
-                            "button_text": button_text.strip() if button_text else None,
-                        }
-                    )
-                    logger.debug(f"Found open grant: {button_text}")
-        else:
-            logger.debug(f"Skipping closed grant (card {i + 1})")
+# True once the card-body exists and has rendered some text
+_CARD_BODY_READY_JS = "(selector) => (document.querySelector(selector)?.innerText || '').trim().length > 0"
 
-    logger.info(
-        f"Extracted {len(grant_links)} open grants from {total_cards} total cards"
-    )
-    return grant_links
+# How long to wait for a grant detail page's card-body to render
+CARD_BODY_TIMEOUT_MS = 60000
+
+
+def _open_grant_page(
+    page: Page, url: str, timeout: float = CARD_BODY_TIMEOUT_MS
+) -> None:
+    """Navigate to a grant detail page and wait until its card-body has rendered.
+
+    Waits for the content itself instead of a fixed delay, so extraction starts
+    as soon as the card-body has text. A card-body that is present but never
+    gets any text is extracted as it is rather than failing the grant.
+    """
+    page.goto(url, wait_until="commit", timeout=timeout)
+    try:
+        page.wait_for_function(
+            _CARD_BODY_READY_JS, arg=CARD_BODY_SELECTOR, timeout=timeout
+        )
+    except PlaywrightTimeoutError:
+        if page.query_selector(CARD_BODY_SELECTOR) is None:
+            raise
+        logger.warning(f"Card-body at {url} has no text, using it as is")
 
 
 def extract_card_body_content(page: Page, url: str) -> str:
     """Extract the content from the card-body div on a grant detail page.
 
+    Prefer extract_card_body_html_and_links(), which returns the links from
+    the same page visit.
+
     Args:
         page: Playwright page object
         url: URL of the grant detail page to visit
@@ -88,22 +202,17 @@ def extract_card_body_content(page: Page, url: str) -> str:
     Returns:
         HTML content of the card-body div as a string
     """
-    page.goto(url, wait_until="domcontentloaded", timeout=5000)
-    # Wait for the card-body to be attached to DOM (not necessarily visible)
-    page.wait_for_selector(".card-body", state="attached", timeout=5000)
-    # Give it a moment to render
-    page.wait_for_timeout(1000)
-
-    # Extract the HTML content of the card-body div
-    card_body = page.locator(".card-body").first
-    html_content = card_body.inner_html()
-
+    # This helper has always given up on a page after 5 seconds
+    html_content, _ = extract_card_body_html_and_links(page, url, timeout=5000)
     return html_content
 
 
 def extract_card_body_text(page: Page, url: str) -> str:
     """Extract clean text content from the card-body div (alternative to HTML extraction).
 
+    Prefer extract_card_body_text_and_links(), which returns the links, issuer
+    and title from the same page visit.
+
     This is recommended for LLM processing as it:
     - Removes HTML markup noise
     - Preserves logical structure (headings, lists, sections)
@@ -117,17 +226,49 @@ def extract_card_body_text(page: Page, url: str) -> str:
     Returns:
         Clean plain text with structure preserved
     """
-    page.goto(url, wait_until="domcontentloaded")
-    # Wait for the card-body to be attached to DOM (not necessarily visible)
-    page.wait_for_selector(".card-body", state="attached", timeout=60000)
-    # Give it a moment to render
-    page.wait_for_timeout(1000)
+    text_content, _, _, _ = extract_card_body_text_and_links(page, url)
+    return text_content
 
-    # Extract clean text content (automatically handles HTML conversion)
-    card_body = page.locator(".card-body").first
-    text_content = card_body.inner_text()
 
-    return text_content
+# Reads the card-body text and hrefs plus the grant issuer and title in one
+# evaluate call; issuer and title are null when their element is missing
+_CARD_BODY_TEXT_JS = """
+(sel) => {
+    const cardBody = document.querySelector(sel.cardBody);
+    const issuer = document.querySelector(sel.issuer);
+    const title = document.querySelector(sel.title);
+    return {
+        text: cardBody ? cardBody.innerText : "",
+        hrefs: cardBody
+            ? Array.from(cardBody.querySelectorAll("a[href]"), a => a.getAttribute("href"))
+            : [],
+        issuer: issuer ? issuer.innerText.trim() : null,
+        title: title ? title.innerText.trim() : null,
+    };
+}
+"""
+
+
+def _parse_card_body_text(data: dict, url: str) -> tuple[str, list[str], str, str]:
+    """Turn the result of _CARD_BODY_TEXT_JS into (text, links, issuer, title)."""
+    issuer = data["issuer"]
+    if issuer is None:
+        logger.warning(f"No {ISSUER_SELECTOR} element found at {url}")
+        issuer = ""
+    else:
+        logger.debug(f"Extracted issuer: {issuer}")
+
+    title = data["title"]
+    if title is None:
+        logger.warning(f"No {TITLE_SELECTOR} element found at {url}")
+        title = ""
+    else:
+        logger.debug(f"Extracted title: {title}")
+
+    # Make links absolute and drop duplicates, keeping the first occurrence
+    unique_links = list(dict.fromkeys(_absolute_links(data["hrefs"], url)))
+
+    return data["text"], unique_links, issuer, title
 
 
 def extract_card_body_text_and_links(
@@ -149,66 +290,59 @@ def extract_card_body_text_and_links(
         - issuer: Grant issuing agency (from .card-title h2)
         - title: Grant title (from #grant-header)
     """
-    page.goto(url, wait_until="domcontentloaded")
-    # Wait for the card-body to be attached to DOM (not necessarily visible)
-    page.wait_for_selector(".card-body", state="attached", timeout=60000)
-    # Give it a moment to render
-    page.wait_for_timeout(1000)
-
-    # Extract grant issuer from .card-title h2
-    issuer = ""
-    try:
-        issuer_element = page.locator(".card-title h2").first
-        if issuer_element.count() > 0:
-            issuer = issuer_element.inner_text().strip()
-            logger.debug(f"Extracted issuer: {issuer}")
-        else:
-            logger.warning(f"No .card-title h2 element found at {url}")
-    except Exception as e:
-        logger.warning(f"Could not extract grant issuer from {url}: {e}")
+    _open_grant_page(page, url)
+    return _parse_card_body_text(page.evaluate(_CARD_BODY_TEXT_JS, _SELECTORS), url)
 
-    # Extract grant title from #grant-header
-    title = ""
-    try:
-        title_element = page.locator("#grant-header").first
-        if title_element.count() > 0:
-            title = title_element.inner_text().strip()
-            logger.debug(f"Extracted title: {title}")
-        else:
-            logger.warning(f"No #grant-header element found at {url}")
-    except Exception as e:
-        logger.warning(f"Could not extract grant title from {url}: {e}")
 
-    card_body = page.locator(".card-body").first
+# Reads the card-body HTML and hrefs in one evaluate call
+_CARD_BODY_HTML_JS = """
+(selector) => {
+    const cardBody = document.querySelector(selector);
+    return {
+        html: cardBody ? cardBody.innerHTML : "",
+        hrefs: cardBody
+            ? Array.from(cardBody.querySelectorAll("a[href]"), a => a.getAttribute("href"))
+            : [],
+    };
+}
+"""
 
-    # Extract clean text content
-    text_content = card_body.inner_text()
 
-    # Extract all links from the card-body
-    links = []
-    link_elements = card_body.locator("a[href]")
+def _parse_card_body_html(data: dict, url: str) -> tuple[str, list[str]]:
+    """Turn the result of _CARD_BODY_HTML_JS into (html, links)."""
+    return data["html"], list(dict.fromkeys(_absolute_links(data["hrefs"], url)))
 
-    for i in range(link_elements.count()):
-        href = link_elements.nth(i).get_attribute("href")
-        if href:
-            # Convert relative URLs to absolute
-            if href.startswith("http"):
-                links.append(href)
-            else:
-                # Use urljoin to properly handle relative URLs
-                absolute_url = urljoin(url, href)
-                links.append(absolute_url)
 
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_links = [link for link in links if link not in seen and not seen.add(link)]
+def extract_card_body_html_and_links(
+    page: Page, url: str, timeout: float = CARD_BODY_TIMEOUT_MS
+) -> tuple[str, list[str]]:
+    """Extract the card-body HTML and its links in a single page visit.
 
-    return text_content, unique_links, issuer, title
+    This is the HTML counterpart of extract_card_body_text_and_links(), and
+    avoids loading the page twice as separate content and link extraction would.
+
+    Args:
+        page: Playwright page object
+        url: URL of the grant detail page to visit
+        timeout: Milliseconds to wait for the page and its card-body
+
+    Returns:
+        Tuple of (html_content, links) where:
+        - html_content: HTML content of the card-body div
+        - links: List of absolute URLs found in the card-body
+    """
+    _open_grant_page(page, url, timeout)
+    return _parse_card_body_html(
+        page.evaluate(_CARD_BODY_HTML_JS, CARD_BODY_SELECTOR), url
+    )
 
 
 def extract_links_from_card_body(page: Page, url: str) -> list[str]:
     """Extract all links (href attributes) from the card-body div.
 
+    Prefer extract_card_body_html_and_links(), which returns the HTML from
+    the same page visit.
+
     Args:
         page: Playwright page object
         url: URL of the grant detail page to visit
@@ -216,43 +350,47 @@ def extract_links_from_card_body(page: Page, url: str) -> list[str]:
     Returns:
         List of absolute URLs found in the card-body
     """
-    page.goto(url, wait_until="domcontentloaded")
-    # Wait for the card-body to be attached to DOM (not necessarily visible)
-    page.wait_for_selector(".card-body", state="attached", timeout=60000)
-    # Give it a moment to render
-    page.wait_for_timeout(1000)
-
-    # Extract all links from the card-body
-    card_body = page.locator(".card-body").first
-    links = []
-    link_elements = card_body.locator("a[href]")
+    _, links = extract_card_body_html_and_links(page, url)
+    return links
 
-    for i in range(link_elements.count()):
-        href = link_elements.nth(i).get_attribute("href")
-        if href:
-            # Convert relative URLs to absolute
-            if href.startswith("http"):
-                links.append(href)
-            else:
-                # Use urljoin to properly handle relative URLs
-                absolute_url = urljoin(url, href)
-                links.append(absolute_url)
 
-    return links
+def _grant_url_key(url: str) -> str:
+    """Normalise a grant URL so links to the same page compare equal."""
+    return url.split("#")[0].rstrip("/")
 
 
-def get_grant_details(
+def _grant_detail_dict(
+    grant: dict[str, str],
+    use_text: bool,
+    content: str | None,
+    links: list[str],
+    issuer: str = "",
+    title: str = "",
+) -> dict:
+    """Build the per-grant result dict returned by the get_grant_details* functions."""
+    key = "card_body_text" if use_text else "card_body_html"
+    return {
+        "url": grant["url"],
+        "button_text": grant["button_text"],
+        key: content,
+        "links": links,
+        "issuer": issuer,
+        "title": title,
+    }
+
+
+def iter_grant_details(
     page: Page,
     grant_links: list[dict[str, str]],
     use_text: bool = True,
     job_id: str | None = None,
-) -> list[dict[str, str]]:
-    """Visit all grant links and extract card-body content.
+) -> Iterator[dict]:
+    """Visit grant links one at a time, yielding each grant's card-body content.
 
-    This function is designed to extract grant content for LLM processing.
-    By default, it returns clean text (recommended for LLMs), but can also
-    return HTML if needed. Also extracts links from the card-body for deep scraping,
-    as well as grant issuer and title.
+    Generator version of get_grant_details(). Each result is yielded as soon
+    as its page is scraped and is not kept afterwards, so a caller that
+    handles results one by one (e.g. writes them out) holds one grant's
+    content in memory rather than all of them.
 
     Args:
         page: Playwright page object
@@ -260,24 +398,35 @@ def get_grant_details(
         use_text: If True, extract clean text (recommended for LLM). If False, extract HTML.
         job_id: Optional job ID for status tracking
 
-    Returns:
-        List of dictionaries with:
-        - 'url': Grant URL
-        - 'button_text': Button text from listing page
-        - 'card_body_text' or 'card_body_html': Extracted content (depending on use_text)
-        - 'links': List of URLs found in the card-body
-        - 'issuer': Grant issuing agency
-        - 'title': Grant title
+    Yields:
+        One dictionary per grant link, in order, as described in get_grant_details()
     """
-    grant_details = []
     total_grants = len(grant_links)
+    # How many more times each normalised URL appears; results are only kept
+    # while a later duplicate still needs them, so each URL is visited once
+    remaining = Counter(_grant_url_key(grant["url"]) for grant in grant_links)
+    scraped: dict[str, dict] = {}
 
     # Import status tracking if job_id provided
     if job_id:
         from app.services.refresh_status import RefreshPhase, update_refresh_status
 
     for idx, grant in enumerate(grant_links, start=1):
-        print(f"Extracting content from: {grant['url']}")
+        key = _grant_url_key(grant["url"])
+        remaining[key] -= 1
+        if key in scraped:
+            logger.info(f"Reusing already extracted content for: {grant['url']}")
+            detail = {
+                **scraped[key],
+                "url": grant["url"],
+                "button_text": grant["button_text"],
+            }
+            if not remaining[key]:
+                del scraped[key]
+            yield detail
+            continue
+
+        logger.info(f"Extracting content from: {grant['url']}")
 
         # Update progress if job_id provided
         if job_id:
@@ -299,80 +448,464 @@ def get_grant_details(
                     f"Extracted grant - Issuer: '{issuer}', Title: '{title}', "
                     f"Links: {len(links)}, Content: {len(card_body_content)} chars"
                 )
-                grant_details.append(
-                    {
-                        "url": grant["url"],
-                        "button_text": grant["button_text"],
-                        "card_body_text": card_body_content,
-                        "links": links,
-                        "issuer": issuer,
-                        "title": title,
-                    }
+                detail = _grant_detail_dict(
+                    grant, use_text, card_body_content, links, issuer, title
                 )
             else:
-                # Extract HTML - for other use cases
-                card_body_content = extract_card_body_content(page, grant["url"])
-                # Still need to extract links separately when using HTML
-                links = extract_links_from_card_body(page, grant["url"])
-                grant_details.append(
-                    {
-                        "url": grant["url"],
-                        "button_text": grant["button_text"],
-                        "card_body_html": card_body_content,
-                        "links": links,
-                        "issuer": "",
-                        "title": "",
-                    }
+                # Extract HTML and links in a single page visit - for other use cases
+                card_body_content, links = extract_card_body_html_and_links(
+                    page, grant["url"]
                 )
+                detail = _grant_detail_dict(grant, use_text, card_body_content, links)
+        except Exception as e:
+            logger.exception(f"Error extracting content from {grant['url']}: {e}")
+            detail = {**_grant_detail_dict(grant, use_text, None, []), "error": str(e)}
+
+        if remaining[key]:
+            scraped[key] = detail
+        yield detail
+
+
+def get_grant_details(
+    page: Page,
+    grant_links: list[dict[str, str]],
+    use_text: bool = True,
+    job_id: str | None = None,
+) -> list[dict[str, str]]:
+    """Visit all grant links and extract card-body content.
+
+    This function is designed to extract grant content for LLM processing.
+    By default, it returns clean text (recommended for LLMs), but can also
+    return HTML if needed. Also extracts links from the card-body for deep scraping,
+    as well as grant issuer and title. Use iter_grant_details() to handle
+    grants one at a time instead of collecting them all.
+
+    Args:
+        page: Playwright page object
+        grant_links: List of grant link dictionaries with 'url' and 'button_text'
+        use_text: If True, extract clean text (recommended for LLM). If False, extract HTML.
+        job_id: Optional job ID for status tracking
+
+    Returns:
+        List of dictionaries with:
+        - 'url': Grant URL
+        - 'button_text': Button text from listing page
+        - 'card_body_text' or 'card_body_html': Extracted content (depending on use_text)
+        - 'links': List of URLs found in the card-body
+        - 'issuer': Grant issuing agency
+        - 'title': Grant title
+    """
+    return list(iter_grant_details(page, grant_links, use_text=use_text, job_id=job_id))
+
+
+async def _open_grant_page_async(
+    page: AsyncPage, url: str, timeout: float = CARD_BODY_TIMEOUT_MS
+) -> None:
+    """Async version of _open_grant_page()."""
+    await page.goto(url, wait_until="commit", timeout=timeout)
+    try:
+        await page.wait_for_function(
+            _CARD_BODY_READY_JS, arg=CARD_BODY_SELECTOR, timeout=timeout
+        )
+    except PlaywrightTimeoutError:
+        if await page.query_selector(CARD_BODY_SELECTOR) is None:
+            raise
+        logger.warning(f"Card-body at {url} has no text, using it as is")
+
+
+async def extract_card_body_text_and_links_async(
+    page: AsyncPage, url: str
+) -> tuple[str, list[str], str, str]:
+    """Async version of extract_card_body_text_and_links().
+
+    Args:
+        page: Playwright async page object
+        url: URL of the grant detail page to visit
+
+    Returns:
+        Tuple of (text_content, links, issuer, title)
+    """
+    await _open_grant_page_async(page, url)
+    return _parse_card_body_text(
+        await page.evaluate(_CARD_BODY_TEXT_JS, _SELECTORS), url
+    )
+
+
+async def extract_card_body_html_and_links_async(
+    page: AsyncPage, url: str
+) -> tuple[str, list[str]]:
+    """Extract the card-body HTML and its links in a single page visit.
+
+    Args:
+        page: Playwright async page object
+        url: URL of the grant detail page to visit
+
+    Returns:
+        Tuple of (html_content, links)
+    """
+    await _open_grant_page_async(page, url)
+    return _parse_card_body_html(
+        await page.evaluate(_CARD_BODY_HTML_JS, CARD_BODY_SELECTOR), url
+    )
+
+
+# Resource types grant detail pages never need for text extraction.
+# Stylesheets are kept because innerText depends on computed styles.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "websocket"})
+
+
+async def _block_unneeded_resources(route) -> None:
+    """Route handler that aborts requests for BLOCKED_RESOURCE_TYPES."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class PagePool:
+    """A fixed set of warm pages in one browser context, leased one at a time.
+
+    Reusing pages avoids paying page setup for every grant and caps how many
+    tabs are open at once. Pages are reset to about:blank when handed back so
+    the previous grant page can be freed. With block_resources, images, fonts
+    and media are not downloaded on pool pages.
+
+    Usage:
+        async with PagePool(context, size=5) as pool:
+            async with pool.lease() as page:
+                await page.goto(url)
+    """
+
+    def __init__(
+        self, context: AsyncBrowserContext, size: int, block_resources: bool = False
+    ):
+        self._context = context
+        self._size = size
+        self._block_resources = block_resources
+        # None is put on the queue once no pages are left, to wake waiters
+        self._idle: asyncio.Queue[AsyncPage | None] = asyncio.Queue()
+        self._pages: list[AsyncPage] = []
+
+    async def _new_page(self) -> AsyncPage:
+        page = await self._context.new_page()
+        if self._block_resources:
+            # Routed per page, not on the context, so other pages in the same
+            # context (like the listing page) still load everything
+            await page.route("**/*", _block_unneeded_resources)
+        self._pages.append(page)
+        return page
+
+    async def __aenter__(self) -> "PagePool":
+        for _ in range(self._size):
+            page = await self._new_page()
+            self._idle.put_nowait(page)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def acquire(self) -> AsyncPage:
+        """Wait for an idle page and take it out of the pool.
+
+        Raises:
+            RuntimeError: If every page in the pool has broken and could not
+                be replaced, so waiting would never end
+        """
+        if not self._pages:
+            raise RuntimeError("PagePool has no working pages left")
+        page = await self._idle.get()
+        if page is None:
+            # Pass the wake-up on to the next waiter
+            self._idle.put_nowait(None)
+            raise RuntimeError("PagePool has no working pages left")
+        return page
+
+    async def release(self, page: AsyncPage) -> None:
+        """Reset a page and return it to the pool, replacing it if it broke.
+
+        If no replacement can be opened the pool shrinks; once it is empty,
+        pending and future acquire() calls raise instead of waiting forever.
+        """
+        try:
+            await page.goto("about:blank")
+        except Exception as e:
+            logger.warning(f"Replacing broken page in pool: {e}")
+            self._pages.remove(page)
+            try:
+                await page.close()
+            except Exception as close_error:
+                logger.warning(f"Failed to close broken page: {close_error}")
+            try:
+                page = await self._new_page()
+            except Exception as new_page_error:
+                logger.error(f"Failed to replace broken page: {new_page_error}")
+                if not self._pages:
+                    self._idle.put_nowait(None)
+                return
+        self._idle.put_nowait(page)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[AsyncPage]:
+        """Borrow a page for the duration of a with block."""
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self) -> None:
+        """Close every page owned by the pool."""
+        for page in self._pages:
+            await page.close()
+        self._pages.clear()
+
+
+class BrowserPool:
+    """One browser and context, launched once and shared by every scrape phase.
+
+    The listing page and the concurrent detail pages all open in the same
+    context, so a refresh pays for a single Chromium start-up.
+
+    Usage:
+        async with BrowserPool(headless=True) as browser_pool:
+            page = await browser_pool.new_page()
+            async with browser_pool.page_pool() as pool:
+                ...
+    """
+
+    def __init__(
+        self, headless: bool = True, size: int = DEFAULT_MAX_CONCURRENCY
+    ) -> None:
+        self._headless = headless
+        self._size = size
+        self._playwright = None
+        self._browser = None
+        self.context: AsyncBrowserContext | None = None
+
+    async def __aenter__(self) -> "BrowserPool":
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(
+                headless=self._headless
+            )
+            self.context = await self._browser.new_context()
+        except Exception:
+            await self._playwright.stop()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+        finally:
+            await self._playwright.stop()
+
+    async def new_page(self) -> AsyncPage:
+        """Open a single page in the shared context."""
+        return await self.context.new_page()
+
+    def page_pool(
+        self, size: int | None = None, block_resources: bool = False
+    ) -> PagePool:
+        """Create a PagePool of warm pages in the shared context."""
+        return PagePool(self.context, size or self._size, block_resources)
+
+
+async def get_grant_details_async(
+    context: AsyncBrowserContext,
+    grant_links: list[dict[str, str]],
+    use_text: bool = True,
+    job_id: str | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[dict]:
+    """Concurrent version of get_grant_details().
+
+    Opens a PagePool of up to max_concurrency pages in the given browser
+    context; each grant borrows a page, scrapes it and hands it back.
+
+    Args:
+        context: Playwright async browser context to open pages in
+        grant_links: List of grant link dictionaries with 'url' and 'button_text'
+        use_text: If True, extract clean text (recommended for LLM). If False, extract HTML.
+        job_id: Optional job ID for status tracking
+        max_concurrency: Maximum number of pages loading at the same time
+
+    Returns:
+        Same list of dictionaries as get_grant_details(), in the same order
+        as grant_links
+    """
+    # Normalised URL -> first grant with that URL, so duplicates are visited once
+    unique_grants: dict[str, dict[str, str]] = {}
+    for grant in grant_links:
+        unique_grants.setdefault(_grant_url_key(grant["url"]), grant)
+
+    total_grants = len(unique_grants)
+    if not total_grants:
+        return []
+
+    # Import status tracking if job_id provided
+    if job_id:
+        from app.services.refresh_status import RefreshPhase, update_refresh_status
+
+    completed = 0
+
+    async def scrape_one(pool: PagePool, grant: dict[str, str]) -> dict:
+        nonlocal completed
+        try:
+            async with pool.lease() as page:
+                logger.info(f"Extracting content from: {grant['url']}")
+                if use_text:
+                    (
+                        content,
+                        links,
+                        issuer,
+                        title,
+                    ) = await extract_card_body_text_and_links_async(page, grant["url"])
+                    logger.info(
+                        f"Extracted grant - Issuer: '{issuer}', Title: '{title}', "
+                        f"Links: {len(links)}, Content: {len(content)} chars"
+                    )
+                    detail = _grant_detail_dict(
+                        grant, use_text, content, links, issuer, title
+                    )
+                else:
+                    content, links = await extract_card_body_html_and_links_async(
+                        page, grant["url"]
+                    )
+                    detail = _grant_detail_dict(grant, use_text, content, links)
         except Exception as e:
-            print(f"Error extracting content from {grant['url']}: {e}")
-            key = "card_body_text" if use_text else "card_body_html"
-            grant_details.append(
-                {
-                    "url": grant["url"],
-                    "button_text": grant["button_text"],
-                    key: None,
-                    "links": [],
-                    "issuer": "",
-                    "title": "",
-                    "error": str(e),
-                }
+            logger.exception(f"Error extracting content from {grant['url']}: {e}")
+            detail = {**_grant_detail_dict(grant, use_text, None, []), "error": str(e)}
+
+        completed += 1
+        if job_id:
+            update_refresh_status(
+                job_id,
+                RefreshPhase.SCRAPING_DETAILS,
+                total_found=total_grants,
+                current_grant=completed,
+                message=f"Scraped grant {completed} of {total_grants}",
             )
+        return detail
 
+    async with PagePool(
+        context, min(max_concurrency, total_grants), block_resources=True
+    ) as pool:
+        details = await asyncio.gather(
+            *(scrape_one(pool, grant) for grant in unique_grants.values())
+        )
+    scraped = dict(zip(unique_grants, details))
+
+    grant_details = []
+    for grant in grant_links:
+        key = _grant_url_key(grant["url"])
+        detail = scraped[key]
+        if unique_grants[key] is not grant:
+            detail = {
+                **detail,
+                "url": grant["url"],
+                "button_text": grant["button_text"],
+            }
+        grant_details.append(detail)
     return grant_details
 
 
+def fetch_grant_details(
+    grant_links: list[dict[str, str]],
+    use_text: bool = True,
+    job_id: str | None = None,
+    headless: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[dict]:
+    """Scrape grant details concurrently in a browser of its own.
+
+    Synchronous wrapper around get_grant_details_async(). It runs its own
+    event loop, so it must not be called from inside a sync_playwright()
+    block or a running asyncio loop.
+
+    Args:
+        grant_links: List of grant link dictionaries with 'url' and 'button_text'
+        use_text: If True, extract clean text (recommended for LLM). If False, extract HTML.
+        job_id: Optional job ID for status tracking
+        headless: Whether to run browser in headless mode
+        max_concurrency: Maximum number of pages loading at the same time
+
+    Returns:
+        Same list of dictionaries as get_grant_details()
+    """
+
+    async def run() -> list[dict]:
+        async with BrowserPool(headless=headless) as browser_pool:
+            return await get_grant_details_async(
+                browser_pool.context,
+                grant_links,
+                use_text=use_text,
+                job_id=job_id,
+                max_concurrency=max_concurrency,
+            )
+
+    return asyncio.run(run())
+
+
+def _fetch_grant_details_on(
+    page: Page | None,
+    grant_links: list[dict[str, str]],
+    use_text: bool,
+    job_id: str | None,
+    headless: bool,
+) -> list[dict]:
+    """Scrape grant details concurrently, or one by one on page if a caller still passes one."""
+    if page is None:
+        return fetch_grant_details(
+            grant_links, use_text=use_text, job_id=job_id, headless=headless
+        )
+    warnings.warn(
+        "Passing page is deprecated; grant details are now scraped concurrently "
+        "in a browser of their own",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return get_grant_details(page, grant_links, use_text=use_text, job_id=job_id)
+
+
 def get_grant_details_as_models(
-    page: Page,
     grant_links: list[dict[str, str]],
     use_text: bool = True,
     job_id: str | None = None,
+    headless: bool = True,
+    *,
+    page: Page | None = None,
 ) -> list["Grant"]:
     """Get grant details and return as Grant SQLAlchemy model instances.
 
-    This is a convenience wrapper around get_grant_details() that converts
+    This is a convenience wrapper around fetch_grant_details() that converts
     the dictionaries to Grant model instances.
 
     Args:
-        page: Playwright page object
         grant_links: List of grant link dictionaries with 'url' and 'button_text'
         use_text: If True, extract clean text (recommended for LLM). If False, extract HTML.
         job_id: Optional job ID for status tracking
+        headless: Whether to run browser in headless mode
+        page: Deprecated. Scrape sequentially on this page instead of in a
+            browser of its own
 
     Returns:
         List of Grant SQLAlchemy model instances (not yet persisted to database)
     """
     from app.models.models import Grant
 
-    grant_dicts = get_grant_details(page, grant_links, use_text=use_text, job_id=job_id)
+    grant_dicts = _fetch_grant_details_on(page, grant_links, use_text, job_id, headless)
     return [Grant.from_scraper_dict(grant_dict) for grant_dict in grant_dicts]
 
 
 def save_grants_to_db(
-    page: Page,
     grant_links: list[dict[str, str]],
     use_text: bool = True,
     job_id: str | None = None,
+    headless: bool = True,
+    *,
+    page: Page | None = None,
 ) -> list["Grant"]:
     """Scrape grant details and save them to the database.
 
@@ -381,24 +914,41 @@ def save_grants_to_db(
     - Saves or updates grants in the database (matched by URL)
 
     Args:
-        page: Playwright page object
         grant_links: List of grant link dictionaries with 'url' and 'button_text'
         use_text: If True, extract clean text (recommended for LLM). If False, extract HTML.
         job_id: Optional job ID for status tracking
+        headless: Whether to run browser in headless mode
+        page: Deprecated. Scrape sequentially on this page instead of in a
+            browser of its own
 
     Returns:
         List of saved Grant SQLAlchemy model instances
     """
-    from app.access import GrantAccess, get_db_session
-
     logger.info(f"Extracting details for {len(grant_links)} grants...")
 
-    # Get grant details as model instances
-    grant_models = get_grant_details_as_models(
-        page, grant_links, use_text=use_text, job_id=job_id
+    grant_details = _fetch_grant_details_on(
+        page, grant_links, use_text, job_id, headless
     )
+    return _save_grant_details(grant_details, job_id=job_id)
+
+
+# Number of grants written per upsert statement when saving scraped grants
+SAVE_CHUNK_SIZE = 20
 
-    logger.info(f"Saving {len(grant_models)} grants to database...")
+
+def _save_grant_details(
+    grant_details: list[dict], job_id: str | None = None
+) -> list["Grant"]:
+    """Save scraped grant dictionaries to the database, matched by URL.
+
+    Grant models are built and upserted SAVE_CHUNK_SIZE at a time, so only one
+    chunk of unsaved models exists at once and each statement stays small.
+    """
+    from app.access import GrantAccess, get_db_session
+    from app.models.models import Grant
+
+    total = len(grant_details)
+    logger.info(f"Saving {total} grants to database...")
 
     # Update status if job_id provided
     if job_id:
@@ -407,14 +957,27 @@ def save_grants_to_db(
         update_refresh_status(
             job_id,
             RefreshPhase.SAVING_TO_DB,
-            total_found=len(grant_models),
+            total_found=total,
             grants_saved=0,
-            message=f"Saving {len(grant_models)} grants to database",
+            message=f"Saving {total} grants to database",
         )
 
     # Save to database (create or update by URL)
+    saved_grants = []
     with get_db_session() as db:
-        saved_grants = GrantAccess.create_or_update_many_by_url(db, grant_models)
+        for start in range(0, total, SAVE_CHUNK_SIZE):
+            chunk = [
+                Grant.from_scraper_dict(grant_dict)
+                for grant_dict in grant_details[start : start + SAVE_CHUNK_SIZE]
+            ]
+            saved_grants.extend(GrantAccess.create_or_update_many_by_url(db, chunk))
+            if job_id and len(saved_grants) < total:
+                update_refresh_status(
+                    job_id,
+                    RefreshPhase.SAVING_TO_DB,
+                    grants_saved=len(saved_grants),
+                    message=f"Saved {len(saved_grants)} of {total} grants",
+                )
 
     # Update final save count
     if job_id:
@@ -429,9 +992,156 @@ def save_grants_to_db(
     return saved_grants
 
 
+# True once the grant cards differ from the snapshot taken before the filter
+# click: a different number of cards, or a different first card
+_CARDS_CHANGED_JS = """
+([selector, before]) => {
+    const cards = document.querySelectorAll(selector);
+    return cards.length > 0 && (cards.length !== before.length || cards[0] !== before[0]);
+}
+"""
+
+# How long to wait for the Organisation filter to re-render the grant cards
+FILTER_APPLY_TIMEOUT_MS = 5000
+
 # Screenshot directory - ensure screenshots go to backend/.private/screenshots
 SCREENSHOT_DIR = Path(__file__).parent.parent.parent / ".private" / "screenshots"
-SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Debug screenshots are viewport-sized JPEGs; much cheaper to encode than
+# full-page PNGs and plenty to see the state of the listing page
+SCREENSHOT_JPEG_QUALITY = 70
+
+
+async def _take_screenshot(
+    page: AsyncPage, filename: str, pending_writes: list[asyncio.Task]
+) -> None:
+    """Capture a JPEG screenshot of the viewport and write it to SCREENSHOT_DIR off the event loop.
+
+    The file write runs in a worker thread so scraping carries on meanwhile;
+    the task is appended to pending_writes for the caller to await.
+    """
+    image = await page.screenshot(type="jpeg", quality=SCREENSHOT_JPEG_QUALITY)
+    pending_writes.append(
+        asyncio.create_task(
+            asyncio.to_thread((SCREENSHOT_DIR / filename).write_bytes, image)
+        )
+    )
+
+
+async def _get_open_grant_links_async(
+    page: AsyncPage,
+    take_screenshots: bool = False,
+    timestamp: str = "",
+    job_id: str | None = None,
+) -> list[dict[str, str]]:
+    """Open the grants listing page, filter it to organisations and collect open grants.
+
+    Args:
+        page: Playwright async page to load the listing in
+        take_screenshots: Whether to save screenshots of each step
+        timestamp: Timestamp used in screenshot file names
+        job_id: Optional job ID for status tracking
+
+    Returns:
+        List of dictionaries with 'url' and 'button_text' keys
+    """
+    # Import status tracking if job_id provided
+    if job_id:
+        from app.services.refresh_status import RefreshPhase, update_refresh_status
+
+    pending_writes: list[asyncio.Task] = []
+
+    # Navigate to grants page
+    logger.info("Navigating to grants listing page...")
+    if job_id:
+        update_refresh_status(
+            job_id, RefreshPhase.NAVIGATING, message="Navigating to grants page"
+        )
+    # Only wait for the response to start; the filter selector wait below is
+    # what tells us the page is usable
+    await page.goto(f"{GRANTS_BASE_URL}/grants/new", wait_until="commit")
+
+    # Wait for the filter section to load
+    logger.info("Waiting for filter section to load...")
+    await page.wait_for_selector(ORGANISATION_FILTER_SELECTOR, state="visible")
+    logger.info(f"Page loaded: {await page.title()}")
+
+    if take_screenshots:
+        await _take_screenshot(
+            page, f"screenshot_{timestamp}_01_initial_load.jpg", pending_writes
+        )
+
+    # The goto above only waits for the response to start, so let the
+    # unfiltered cards render before snapshotting them; an empty snapshot
+    # would make the first card to appear look like the filter applying
+    await page.wait_for_selector(GRANT_CARD_SELECTOR, state="visible")
+
+    # Snapshot the cards so we can tell when the filter has re-rendered them
+    cards_before = await page.evaluate_handle(
+        "(selector) => Array.from(document.querySelectorAll(selector))",
+        GRANT_CARD_SELECTOR,
+    )
+
+    # Click on the "Organisation" checkbox
+    logger.info("Clicking Organisation filter...")
+    checkbox = page.locator(ORGANISATION_FILTER_SELECTOR)
+    try:
+        # Try clicking the label associated with the checkbox
+        await page.locator(ORGANISATION_FILTER_LABEL_SELECTOR).click(timeout=5000)
+    except Exception as e:
+        logger.warning(f"Label click failed, using JavaScript fallback: {e}")
+        # If label click fails, use JavaScript to click the checkbox directly
+        await checkbox.evaluate("element => element.click()")
+
+    # Wait for the filter to apply. If it leaves the cards unchanged there is
+    # nothing to wait for, so a timeout here is not an error.
+    try:
+        await page.wait_for_function(
+            _CARDS_CHANGED_JS,
+            arg=[GRANT_CARD_SELECTOR, cards_before],
+            timeout=FILTER_APPLY_TIMEOUT_MS,
+        )
+    except PlaywrightTimeoutError:
+        logger.info("Grant cards did not change after applying the filter")
+    finally:
+        await cards_before.dispose()
+
+    if take_screenshots:
+        await _take_screenshot(
+            page, f"screenshot_{timestamp}_02_after_checkbox_click.jpg", pending_writes
+        )
+
+    # Wait for grant cards to be visible
+    logger.info("Waiting for grant cards to load...")
+    await page.wait_for_selector(GRANT_CARD_SELECTOR, state="visible")
+
+    if take_screenshots:
+        await _take_screenshot(
+            page, f"screenshot_{timestamp}_03_grant_cards_visible.jpg", pending_writes
+        )
+
+    # Extract links for grants that are not closed
+    logger.info("Extracting grant links...")
+    if job_id:
+        update_refresh_status(
+            job_id,
+            RefreshPhase.EXTRACTING_LINKS,
+            message="Extracting grant links",
+        )
+    grant_links = list(
+        _iter_open_grants(await page.evaluate(_GET_LINKS_JS, _SELECTORS))
+    )
+    logger.info(f"Found {len(grant_links)} open grant(s)")
+
+    if take_screenshots:
+        await _take_screenshot(
+            page, f"screenshot_{timestamp}_04_final_state.jpg", pending_writes
+        )
+
+    # Make sure every screenshot reached disk, and surface any write errors
+    await asyncio.gather(*pending_writes)
+
+    return grant_links
 
 
 def scrape_and_refresh_grants(
@@ -451,7 +1161,8 @@ def scrape_and_refresh_grants(
     5. Optionally save to database
 
     Args:
-        take_screenshots: Whether to save screenshots during scraping
+        take_screenshots: Whether to save screenshots during scraping. Only
+            honoured when the SCRAPER_DEBUG=1 environment variable is set.
         headless: Whether to run browser in headless mode
         save_to_db: Whether to save grants to database
         job_id: Optional job ID for status tracking
@@ -465,6 +1176,13 @@ def scrape_and_refresh_grants(
     """
     logger.info("Starting grant scraping process...")
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if take_screenshots and not SCRAPER_DEBUG:
+        logger.warning("Ignoring take_screenshots because SCRAPER_DEBUG is not set")
+        take_screenshots = False
+    if take_screenshots:
+        # Created here rather than at import so importing the module has no
+        # filesystem side effects
+        SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
     errors = []
     grant_urls = []
 
@@ -476,78 +1194,17 @@ def scrape_and_refresh_grants(
             job_id, RefreshPhase.STARTING, message="Initializing browser"
         )
 
-    try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=headless)
-            page = browser.new_page()
-
-            # Navigate to grants page
-            logger.info("Navigating to grants listing page...")
-            if job_id:
-                update_refresh_status(
-                    job_id, RefreshPhase.NAVIGATING, message="Navigating to grants page"
-                )
-            page.goto("https://oursggrants.gov.sg/grants/new")
-            logger.info(f"Page loaded: {page.title()}")
-
-            if take_screenshots:
-                page.screenshot(
-                    path=str(
-                        SCREENSHOT_DIR / f"screenshot_{timestamp}_01_initial_load.png"
-                    ),
-                    full_page=True,
-                )
-
-            # Wait for the filter section to load
-            logger.info("Waiting for filter section to load...")
-            page.wait_for_selector("#applyAs-1", state="visible")
-
-            # Click on the "Organisation" checkbox
-            logger.info("Clicking Organisation filter...")
-            checkbox = page.locator("#applyAs-1")
-            try:
-                # Try clicking the label associated with the checkbox
-                page.locator('label[for="applyAs-1"]').click(timeout=5000)
-            except Exception as e:
-                logger.warning(f"Label click failed, using JavaScript fallback: {e}")
-                # If label click fails, use JavaScript to click the checkbox directly
-                checkbox.evaluate("element => element.click()")
-
-            # Wait a moment for the filter to apply
-            page.wait_for_timeout(1000)
-
-            if take_screenshots:
-                page.screenshot(
-                    path=str(
-                        SCREENSHOT_DIR
-                        / f"screenshot_{timestamp}_02_after_checkbox_click.png"
-                    ),
-                    full_page=True,
-                )
-
-            # Wait for grant cards to be visible
-            logger.info("Waiting for grant cards to load...")
-            page.wait_for_selector('[class*="itemsContainer"]', state="visible")
-
-            if take_screenshots:
-                page.screenshot(
-                    path=str(
-                        SCREENSHOT_DIR
-                        / f"screenshot_{timestamp}_03_grant_cards_visible.png"
-                    ),
-                    full_page=True,
-                )
-
-            # Extract links for grants that are not closed
-            logger.info("Extracting grant links...")
-            if job_id:
-                update_refresh_status(
-                    job_id,
-                    RefreshPhase.EXTRACTING_LINKS,
-                    message="Extracting grant links",
-                )
-            grant_links = get_links(page)
-            logger.info(f"Found {len(grant_links)} open grant(s)")
+    async def scrape() -> tuple[list[dict[str, str]], list[dict]]:
+        # The listing page and the detail pages share one browser
+        async with BrowserPool(headless=headless) as browser_pool:
+            page = await browser_pool.new_page()
+            grant_links = await _get_open_grant_links_async(
+                page,
+                take_screenshots=take_screenshots,
+                timestamp=timestamp,
+                job_id=job_id,
+            )
+            await page.close()
 
             for grant in grant_links:
                 logger.info(f"  - {grant['button_text']}: {grant['url']}")
@@ -561,55 +1218,47 @@ def scrape_and_refresh_grants(
                     message=f"Found {len(grant_links)} grants, starting detailed scraping",
                 )
 
-            if take_screenshots:
-                page.screenshot(
-                    path=str(
-                        SCREENSHOT_DIR / f"screenshot_{timestamp}_04_final_state.png"
-                    ),
-                    full_page=True,
-                )
+            if not (save_to_db and grant_links):
+                return grant_links, []
 
-            # Save to database if requested
-            grants_saved = 0
-            if save_to_db and grant_links:
-                logger.info("Saving grants to database...")
-                if job_id:
-                    update_refresh_status(
-                        job_id,
-                        RefreshPhase.SAVING_TO_DB,
-                        total_found=len(grant_links),
-                        message="Saving grants to database",
-                    )
-                try:
-                    saved_grants = save_grants_to_db(
-                        page, grant_links, use_text=True, job_id=job_id
-                    )
-                    grants_saved = len(saved_grants)
-                    logger.info(f"Successfully saved {grants_saved} grants to database")
-                except Exception as e:
-                    error_msg = f"Error saving grants to database: {e}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-
-            browser.close()
-            logger.info("Scraping completed successfully")
-
-            result = {
-                "total_found": len(grant_links),
-                "grants_saved": grants_saved,
-                "grant_urls": grant_urls,
-                "errors": errors,
-            }
+            logger.info(f"Extracting details for {len(grant_links)} grants...")
+            grant_details = await get_grant_details_async(
+                browser_pool.context, grant_links, use_text=True, job_id=job_id
+            )
+            return grant_links, grant_details
 
-            # Update final status
-            if job_id:
-                from app.services.refresh_status import complete_refresh
+    try:
+        grant_links, grant_details = asyncio.run(scrape())
 
-                complete_refresh(
-                    job_id, len(grant_links), grants_saved, grant_urls, errors
-                )
+        # Save to database if requested
+        grants_saved = 0
+        if grant_details:
+            logger.info("Saving grants to database...")
+            try:
+                saved_grants = _save_grant_details(grant_details, job_id=job_id)
+                grants_saved = len(saved_grants)
+                logger.info(f"Successfully saved {grants_saved} grants to database")
+            except Exception as e:
+                error_msg = f"Error saving grants to database: {e}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+
+        logger.info("Scraping completed successfully")
+
+        result = {
+            "total_found": len(grant_links),
+            "grants_saved": grants_saved,
+            "grant_urls": grant_urls,
+            "errors": errors,
+        }
+
+        # Update final status
+        if job_id:
+            from app.services.refresh_status import complete_refresh
+
+            complete_refresh(job_id, len(grant_links), grants_saved, grant_urls, errors)
 
-            return result
+        return result
 
     except Exception as e:
         error_msg = f"Error during scraping: {e}"
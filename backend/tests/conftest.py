@@ -0,0 +1,89 @@
+"""Shared Playwright fixtures and page stubs for the scraper tests."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+from app.services.scraper import BLOCKED_RESOURCE_TYPES
+
+# Chromium profile kept between test runs, so later runs start with a warm
+# HTTP cache for the grants portal's scripts and stylesheets
+BROWSER_PROFILE_DIR = Path(tempfile.gettempdir()) / "gs_playwright_cache"
+
+
+def _block_unneeded_resources(route) -> None:
+    """Route handler that aborts requests for BLOCKED_RESOURCE_TYPES."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+@pytest.fixture(scope="session")
+def browser_context():
+    """Launch one headless browser with a persistent profile for the whole session.
+
+    Images, fonts and media are blocked, as on the scraper's detail pages.
+    """
+    with sync_playwright() as p:
+        context = p.chromium.launch_persistent_context(
+            str(BROWSER_PROFILE_DIR), headless=True
+        )
+        context.route("**/*", _block_unneeded_resources)
+        yield context
+        context.close()
+
+
+@pytest.fixture
+def page(browser_context):
+    """Create a new page for each test."""
+    page = browser_context.new_page()
+    yield page
+    page.close()
+
+
+class FakeAsyncPage:
+    """Async page stub accepting the calls PagePool makes on its pages.
+
+    A broken page fails every navigation, as if its tab had crashed.
+    """
+
+    def __init__(self, broken: bool = False):
+        self.broken = broken
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def goto(self, url, **kwargs):
+        if self.broken:
+            raise RuntimeError("Target page crashed")
+
+    async def close(self):
+        pass
+
+
+class FakeAsyncContext:
+    """Async browser context stub that hands out FakeAsyncPages.
+
+    Counts the pages opened, and once max_pages have been opened fails to
+    open more, as a closed browser would.
+    """
+
+    def __init__(self, max_pages: int | None = None, broken_pages: bool = False):
+        self.max_pages = max_pages
+        self.broken_pages = broken_pages
+        self.pages_opened = 0
+
+    async def new_page(self):
+        if self.max_pages is not None and self.pages_opened >= self.max_pages:
+            raise RuntimeError("Browser has been closed")
+        self.pages_opened += 1
+        return FakeAsyncPage(broken=self.broken_pages)
+
+
+@pytest.fixture
+def fake_context():
+    """Factory for FakeAsyncContext, taking the same arguments."""
+    return FakeAsyncContext
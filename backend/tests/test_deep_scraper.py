@@ -1,35 +1,20 @@
 """Tests for the deep scraper service."""
 
-import pytest
-from playwright.sync_api import sync_playwright
-from services.deep_scraper import (
+import asyncio
+
+from app.services import deep_scraper
+from app.services.deep_scraper import (
     deep_scrape_grants,
+    deep_scrape_grants_async,
     extract_page_content_and_links,
     scrape_url_recursive,
 )
-from services.scraper import get_grant_details
+from app.services.scraper import get_grant_details
 
 # Test URL provided by user
 TEST_GRANT_URL = "https://oursggrants.gov.sg/grants/aicccmda/instruction"
 
 
-@pytest.fixture(scope="module")
-def browser():
-    """Create a browser instance for testing."""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        yield browser
-        browser.close()
-
-
-@pytest.fixture
-def page(browser):
-    """Create a new page for each test."""
-    page = browser.new_page()
-    yield page
-    page.close()
-
-
 def test_extract_page_content_and_links(page):
     """Test that extract_page_content_and_links extracts content and links from a page."""
     result = extract_page_content_and_links(page, TEST_GRANT_URL)
@@ -195,3 +180,93 @@ def test_deep_scrape_grants_with_max_depth(page):
 
     print(f"\nShallow (depth=1): {len(shallow_result[0]['deep_content'])} pages")
     print(f"Deep (depth=3): {len(deep_result[0]['deep_content'])} pages")
+
+
+# Links on each page of a fake site, for the stubbed deep scrape below
+FAKE_SITE_LINKS = {
+    "https://a.gov.sg/1": ["https://a.gov.sg/2", "https://other.com/y"],
+    "https://a.gov.sg/2": ["https://a.gov.sg/3", "https://a.gov.sg/1"],
+    "https://a.gov.sg/3": ["https://a.gov.sg/4"],
+    "https://other.com/x": ["https://other.com/z"],
+}
+
+
+def test_deep_scrape_grants_async_tree_shape_and_depth_limit(monkeypatch, fake_context):
+    """Nested links follow the grant's domain, stop at max_depth and skip cycles."""
+    fetched: list[str] = []
+
+    async def fake_extract(page, url):
+        fetched.append(url)
+        return {
+            "url": url,
+            "content": f"content of {url}",
+            "links": FAKE_SITE_LINKS.get(url, []),
+            "error": None,
+        }
+
+    monkeypatch.setattr(
+        deep_scraper, "extract_page_content_and_links_async", fake_extract
+    )
+    grant_details = [
+        {
+            "url": "https://a.gov.sg/grant",
+            "links": ["https://a.gov.sg/1", "https://other.com/x", "mailto:x@a.gov.sg"],
+        }
+    ]
+    context = fake_context()
+
+    results = asyncio.run(
+        deep_scrape_grants_async(context, grant_details, max_depth=1, max_concurrency=5)
+    )
+
+    # One page per starting link rather than max_concurrency pages
+    assert context.pages_opened == 2
+    assert sorted(fetched) == [
+        "https://a.gov.sg/1",
+        "https://a.gov.sg/2",
+        "https://other.com/x",
+    ]
+
+    page_1, other = results[0]["deep_content"]
+    assert other["url"] == "https://other.com/x"
+    assert other["content"] == "content of https://other.com/x"
+    # Off-domain links are recorded but not followed
+    assert other["nested_content"] == []
+
+    assert page_1["url"] == "https://a.gov.sg/1"
+    [page_2] = page_1["nested_content"]
+    assert page_2["url"] == "https://a.gov.sg/2"
+    assert page_2["links"] == FAKE_SITE_LINKS["https://a.gov.sg/2"]
+    # Depth 1 is the limit, so page 2's links are not followed
+    assert page_2["nested_content"] == []
+
+
+def test_deep_scrape_grants_async_marks_cycles(monkeypatch, fake_context):
+    """A link back to a page already queued for the grant is not scraped again."""
+
+    async def fake_extract(page, url):
+        return {
+            "url": url,
+            "content": f"content of {url}",
+            "links": FAKE_SITE_LINKS.get(url, []),
+            "error": None,
+        }
+
+    monkeypatch.setattr(
+        deep_scraper, "extract_page_content_and_links_async", fake_extract
+    )
+    grant_details = [{"url": "https://a.gov.sg/grant", "links": ["https://a.gov.sg/1"]}]
+
+    results = asyncio.run(
+        deep_scrape_grants_async(fake_context(), grant_details, max_depth=2)
+    )
+
+    [page_1] = results[0]["deep_content"]
+    [page_2] = page_1["nested_content"]
+    page_3, cycle = page_2["nested_content"]
+    assert page_3["url"] == "https://a.gov.sg/3"
+    assert page_3["content"] == "content of https://a.gov.sg/3"
+    assert page_3["nested_content"] == []
+    assert cycle["url"] == "https://a.gov.sg/1"
+    assert cycle["content"] is None
+    assert cycle["error"] == "Already visited (cycle prevention)"
@@ -0,0 +1,119 @@
+"""Tests for de-duplicating grant URLs in the get_grant_details* functions."""
+
+import asyncio
+
+import pytest
+
+from app.services import scraper
+
+FAILING_URL = "https://example.com/grants/broken"
+
+# Repeated URLs, a duplicate that only differs by fragment and trailing slash,
+# non-adjacent duplicates and a failing URL that appears twice
+GRANT_LINKS = [
+    {"url": "https://example.com/grants/a", "button_text": "A"},
+    {"url": "https://example.com/grants/b", "button_text": "B"},
+    {"url": "https://example.com/grants/a", "button_text": "A again"},
+    {"url": FAILING_URL, "button_text": "Broken"},
+    {"url": "https://example.com/grants/c", "button_text": "C"},
+    {"url": "https://example.com/grants/b/#apply", "button_text": "B again"},
+    {"url": FAILING_URL, "button_text": "Broken again"},
+    {"url": "https://example.com/grants/a", "button_text": "A third time"},
+]
+
+UNIQUE_URLS = [
+    "https://example.com/grants/a",
+    "https://example.com/grants/b",
+    FAILING_URL,
+    "https://example.com/grants/c",
+]
+
+
+def _fake_extract(fetched: list[str]):
+    """Stand-in for extract_card_body_text_and_links() that records each URL."""
+
+    def extract(page, url):
+        fetched.append(url)
+        if url == FAILING_URL:
+            raise RuntimeError("Page failed to load")
+        return f"content of {url}", [f"{url}/file.pdf"], "Issuer", f"Title {url}"
+
+    return extract
+
+
+def _assert_details_match_links(details: list[dict]) -> None:
+    """Results should follow grant_links one for one, duplicates included."""
+    assert len(details) == len(GRANT_LINKS)
+    for grant, detail in zip(GRANT_LINKS, details):
+        assert detail["url"] == grant["url"]
+        assert detail["button_text"] == grant["button_text"]
+        if grant["url"] == FAILING_URL:
+            assert detail["card_body_text"] is None
+            assert detail["error"] == "Page failed to load"
+        else:
+            key = scraper._grant_url_key(grant["url"])
+            assert detail["card_body_text"] == f"content of {key}"
+            assert "error" not in detail
+
+
+def test_get_grant_details_visits_each_url_once(monkeypatch):
+    fetched: list[str] = []
+    monkeypatch.setattr(
+        scraper, "extract_card_body_text_and_links", _fake_extract(fetched)
+    )
+
+    details = scraper.get_grant_details(None, GRANT_LINKS)
+
+    assert fetched == UNIQUE_URLS
+    _assert_details_match_links(details)
+
+
+def test_iter_grant_details_yields_in_input_order(monkeypatch):
+    fetched: list[str] = []
+    monkeypatch.setattr(
+        scraper, "extract_card_body_text_and_links", _fake_extract(fetched)
+    )
+
+    details = scraper.iter_grant_details(None, GRANT_LINKS)
+    first = next(details)
+
+    # Grants are scraped lazily, as they are consumed
+    assert first["url"] == GRANT_LINKS[0]["url"]
+    assert fetched == UNIQUE_URLS[:1]
+
+    _assert_details_match_links([first, *details])
+    assert fetched == UNIQUE_URLS
+
+
+def test_get_grant_details_async_visits_each_url_once(monkeypatch, fake_context):
+    fetched: list[str] = []
+    extract = _fake_extract(fetched)
+
+    async def extract_async(page, url):
+        return extract(page, url)
+
+    monkeypatch.setattr(
+        scraper, "extract_card_body_text_and_links_async", extract_async
+    )
+
+    details = asyncio.run(
+        scraper.get_grant_details_async(fake_context(), GRANT_LINKS, max_concurrency=2)
+    )
+
+    assert sorted(fetched) == sorted(UNIQUE_URLS)
+    _assert_details_match_links(details)
+
+
+def test_get_grant_details_as_models_still_accepts_a_page(monkeypatch):
+    """The deprecated page argument scrapes on that page instead of a new browser."""
+    fetched: list[str] = []
+    monkeypatch.setattr(
+        scraper, "extract_card_body_text_and_links", _fake_extract(fetched)
+    )
+    monkeypatch.setattr(scraper, "fetch_grant_details", pytest.fail)
+
+    with pytest.warns(DeprecationWarning):
+        grants = scraper.get_grant_details_as_models(GRANT_LINKS[:2], page=object())
+
+    assert fetched == UNIQUE_URLS[:2]
+    assert [grant.url for grant in grants] == UNIQUE_URLS[:2]
@@ -0,0 +1,39 @@
+"""Tests for filtering the listing page's grant cards down to open grants."""
+
+from app.services.scraper import GRANTS_BASE_URL, _iter_open_grants
+
+
+def test_iter_open_grants_skips_closed_cards():
+    """Cards flagged closed in the page or by their status text are skipped."""
+    result = {
+        "total": 4,
+        "cards": [
+            {
+                "index": 0,
+                "closed": False,
+                "status": "Closing on 31 Dec 2026",
+                "href": "/grants/open",
+                "button_text": " View Details ",
+            },
+            {"index": 1, "closed": True},
+            {
+                "index": 2,
+                "closed": False,
+                "status": "APPLICATIONS CLOSED",
+                "href": "/grants/closed",
+                "button_text": "View Details",
+            },
+            {
+                "index": 3,
+                "closed": False,
+                "status": "",
+                "href": "https://example.com/grants/external",
+                "button_text": None,
+            },
+        ],
+    }
+
+    assert list(_iter_open_grants(result)) == [
+        {"url": f"{GRANTS_BASE_URL}/grants/open", "button_text": "View Details"},
+        {"url": "https://example.com/grants/external", "button_text": None},
+    ]
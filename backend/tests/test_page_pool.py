@@ -0,0 +1,28 @@
+"""Tests for the scraper's PagePool."""
+
+import asyncio
+
+import pytest
+
+from app.services.scraper import PagePool
+
+
+def test_page_pool_raises_once_every_page_is_lost(fake_context):
+    """Waiters should error out, not hang, when no page can be replaced."""
+    # Opens the initial page, then fails to open a replacement
+    context = fake_context(max_pages=1, broken_pages=True)
+
+    async def run():
+        async with PagePool(context, size=1) as pool:
+            page = await pool.acquire()
+            waiter = asyncio.create_task(pool.acquire())
+            await asyncio.sleep(0)
+
+            await pool.release(page)
+
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(waiter, timeout=1)
+            with pytest.raises(RuntimeError):
+                await pool.acquire()
+
+    asyncio.run(run())
@@ -0,0 +1,24 @@
+"""Tests for the local relevance prefilter."""
+
+from app.services.prefilter import PREFILTER_THRESHOLD, relevance_scores
+
+
+def test_relevance_scores_ranks_on_topic_grant_higher():
+    """A grant sharing vocabulary with the initiative should score higher."""
+    documents = [
+        "Funding for eldercare training programmes for caregivers of seniors",
+        "Grant for marine engineering research and port infrastructure",
+    ]
+    query = "Train family caregivers and eldercare staff to support seniors"
+
+    scores = relevance_scores(documents, query)
+
+    assert len(scores) == 2
+    assert scores[0] > scores[1]
+    assert scores[0] >= PREFILTER_THRESHOLD
+
+
+def test_relevance_scores_handles_empty_text():
+    """Empty documents or an empty query should score 0 rather than fail."""
+    assert relevance_scores(["", "some grant text"], "") == [0.0, 0.0]
+    assert relevance_scores([""], "eldercare") == [0.0]
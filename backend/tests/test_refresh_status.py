@@ -0,0 +1,207 @@
+"""Tests for refresh status tracking."""
+
+import json
+
+from app.services import refresh_status
+from app.services.refresh_status import (
+    STATUS_TTL_SECONDS,
+    RedisStatusStore,
+    RefreshPhase,
+    clear_refresh_status,
+    complete_refresh,
+    create_job_id,
+    get_refresh_status,
+    set_refresh_status,
+    update_refresh_status,
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash commands RedisStatusStore uses.
+
+    Values are kept as strings, as with decode_responses=True, and every
+    command is logged so tests can check what was sent.
+    """
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+        self.commands: list[str] = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def hset(self, key, mapping):
+        self.commands.append("hset")
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def hgetall(self, key):
+        self.commands.append("hgetall")
+        return dict(self.hashes.get(key, {}))
+
+    def expire(self, key, seconds):
+        self.commands.append("expire")
+        self.ttls[key] = seconds
+
+    def delete(self, key):
+        self.commands.append("delete")
+        self.hashes.pop(key, None)
+        self.ttls.pop(key, None)
+
+
+class FakePipeline:
+    """Queues commands and runs them against a FakeRedis on execute()."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._queued = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._queued.append((getattr(self._redis, name), args, kwargs))
+
+        return queue
+
+    def execute(self):
+        for command, args, kwargs in self._queued:
+            command(*args, **kwargs)
+        self._queued.clear()
+
+
+def _fake_redis_store(monkeypatch) -> FakeRedis:
+    """Route the status functions through a RedisStatusStore on a FakeRedis."""
+    fake = FakeRedis()
+    # Skip __init__, which needs the redis package and a server
+    store = RedisStatusStore.__new__(RedisStatusStore)
+    store._redis = fake
+    monkeypatch.setattr(refresh_status, "_redis_store", store)
+    return fake
+
+
+def test_update_refresh_status_preserves_unset_fields():
+    """Fields not passed to an update should keep their previous values."""
+    job_id = create_job_id()
+    try:
+        update_refresh_status(job_id, RefreshPhase.NAVIGATING)
+        update_refresh_status(job_id, RefreshPhase.EXTRACTING_LINKS, total_found=5)
+        update_refresh_status(job_id, RefreshPhase.SCRAPING_DETAILS)
+
+        status = get_refresh_status(job_id)
+
+        assert status["phase"] == RefreshPhase.SCRAPING_DETAILS.value
+        assert status["total_found"] == 5
+    finally:
+        clear_refresh_status(job_id)
+
+
+def test_update_refresh_status_coalesces_progress_ticks(monkeypatch):
+    """Rapid current_grant ticks should only be written every few grants."""
+    # Freeze the clock so every tick lands inside PROGRESS_WRITE_INTERVAL
+    monkeypatch.setattr(refresh_status.time, "monotonic", lambda: 1000.0)
+    job_id = create_job_id()
+    try:
+        update_refresh_status(job_id, RefreshPhase.EXTRACTING_LINKS, total_found=12)
+        for current in range(1, 5):
+            update_refresh_status(
+                job_id,
+                RefreshPhase.SCRAPING_DETAILS,
+                total_found=12,
+                current_grant=current,
+            )
+        assert get_refresh_status(job_id)["current_grant"] == 1
+
+        update_refresh_status(
+            job_id, RefreshPhase.SCRAPING_DETAILS, total_found=12, current_grant=5
+        )
+        assert get_refresh_status(job_id)["current_grant"] == 5
+
+        update_refresh_status(
+            job_id, RefreshPhase.SCRAPING_DETAILS, total_found=12, current_grant=12
+        )
+        assert get_refresh_status(job_id)["current_grant"] == 12
+    finally:
+        clear_refresh_status(job_id)
+
+
+def test_update_refresh_status_drops_throttle_state_on_error():
+    """A job that ends in ERROR should not leave throttle state behind."""
+    job_id = create_job_id()
+    try:
+        update_refresh_status(
+            job_id, RefreshPhase.SCRAPING_DETAILS, total_found=3, current_grant=1
+        )
+        assert job_id in refresh_status._last_write
+
+        update_refresh_status(job_id, RefreshPhase.ERROR, error="boom")
+
+        assert job_id not in refresh_status._last_write
+        assert get_refresh_status(job_id)["phase"] == RefreshPhase.ERROR.value
+    finally:
+        clear_refresh_status(job_id)
+
+
+def test_redis_store_round_trips_json_fields(monkeypatch):
+    """Ints, lists and strings should come back from Redis as they went in."""
+    fake = _fake_redis_store(monkeypatch)
+    job_id = create_job_id()
+
+    complete_refresh(
+        job_id,
+        total_found=3,
+        grants_saved=2,
+        grant_urls=["https://example.com/a", "https://example.com/b"],
+        errors=[],
+    )
+
+    key = f"refresh:{job_id}"
+    assert fake.hashes[key]["total_found"] == "3"
+    assert json.loads(fake.hashes[key]["grant_urls"]) == [
+        "https://example.com/a",
+        "https://example.com/b",
+    ]
+
+    status = get_refresh_status(job_id)
+    assert status["phase"] == RefreshPhase.COMPLETED.value
+    assert status["total_found"] == 3
+    assert status["grants_saved"] == 2
+    assert status["grant_urls"] == ["https://example.com/a", "https://example.com/b"]
+    assert status["errors"] == []
+
+    clear_refresh_status(job_id)
+    assert get_refresh_status(job_id) is None
+
+
+def test_redis_store_update_merges_without_reading(monkeypatch):
+    """Updates should merge into the hash, not read-modify-write the status."""
+    fake = _fake_redis_store(monkeypatch)
+    job_id = create_job_id()
+
+    set_refresh_status(job_id, {"job_id": job_id, "message": "Starting"})
+    fake.commands.clear()
+    # Two writers touching different fields, as the scraper thread and a
+    # request handler do
+    update_refresh_status(job_id, RefreshPhase.EXTRACTING_LINKS, total_found=7)
+    update_refresh_status(job_id, RefreshPhase.SAVING_TO_DB, grants_saved=4)
+
+    assert "hgetall" not in fake.commands
+    status = get_refresh_status(job_id)
+    assert status["phase"] == RefreshPhase.SAVING_TO_DB.value
+    assert status["total_found"] == 7
+    assert status["grants_saved"] == 4
+    assert status["message"] == "Starting"
+
+
+def test_redis_store_sets_expiry_on_every_write(monkeypatch):
+    """set() replaces the hash and both set() and update() refresh its TTL."""
+    fake = _fake_redis_store(monkeypatch)
+    job_id = create_job_id()
+    key = f"refresh:{job_id}"
+
+    update_refresh_status(job_id, RefreshPhase.NAVIGATING, message="Navigating")
+    assert fake.ttls[key] == STATUS_TTL_SECONDS
+
+    fake.ttls.clear()
+    set_refresh_status(job_id, {"job_id": job_id, "phase": RefreshPhase.IDLE})
+    assert fake.ttls[key] == STATUS_TTL_SECONDS
+    # set() replaces the whole status rather than merging into it
+    assert "message" not in get_refresh_status(job_id)